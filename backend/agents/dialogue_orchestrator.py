@@ -6,10 +6,15 @@ import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 import random
 
 logger = logging.getLogger(__name__)
 
+# Emotional-state adjustments layered on top of the per-mode prosody defaults
+_ENERGY_PACE = MappingProxyType({"high": "fast", "low": "slow"})
+_MOOD_VOLUME = MappingProxyType({"sad": "soft", "tired": "soft", "excited": "energetic"})
+
 class DialogueMode(Enum):
     """Available dialogue modes"""
     CHAT = "chat"
@@ -344,23 +349,18 @@ class DialogueOrchestrator:
                             emotional_state: Dict[str, Any]) -> Dict[str, Any]:
         """Get prosody settings for the current mode and emotional state"""
         
-        base_prosody = self.prosody_settings.get(mode, self.prosody_settings[DialogueMode.CHAT])
+        # Copy so per-turn adjustments never leak into the shared mode defaults
+        base_prosody = dict(self.prosody_settings.get(mode, self.prosody_settings[DialogueMode.CHAT]))
         
-        # Adjust based on emotional state
-        energy_level = emotional_state.get("energy_level", "medium")
-        
-        # Adjust pace based on energy
-        if energy_level == "high":
-            base_prosody["pace"] = "fast" if base_prosody["pace"] == "normal" else base_prosody["pace"]
-        elif energy_level == "low":
-            base_prosody["pace"] = "slow" if base_prosody["pace"] == "normal" else base_prosody["pace"]
+        # Adjust pace based on energy (only a normal pace is nudged)
+        if base_prosody["pace"] == "normal":
+            energy_level = emotional_state.get("energy_level", "medium")
+            base_prosody["pace"] = _ENERGY_PACE.get(energy_level, "normal")
         
         # Adjust volume based on mood
-        mood = emotional_state.get("mood", "neutral")
-        if mood in ["sad", "tired"]:
-            base_prosody["volume"] = "soft"
-        elif mood == "excited":
-            base_prosody["volume"] = "energetic"
+        volume = _MOOD_VOLUME.get(emotional_state.get("mood", "neutral"))
+        if volume:
+            base_prosody["volume"] = volume
         
         return base_prosody
     
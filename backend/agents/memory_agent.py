@@ -431,8 +431,8 @@ class MemoryAgent:
         """Update user profile with daily insights"""
         try:
             # Get current profile
-            profile = await self.db.user_profiles.find_one({"id": user_id})
-            if not profile:
+            profile = await self.db.user_profiles.find_one({"id": user_id}, {"interests": 1, "_id": 0})
+            if profile is None:
                 return
             
             # Update interests based on favorite topics
@@ -3,10 +3,15 @@ Main Orchestrator Agent - Central coordinator for all sub-agents with enhanced e
 """
 import asyncio
 import logging
+import collections
+import itertools
+import time
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime
 import uuid
 
+from cachetools import TTLCache
+
 from .voice_agent import VoiceAgent
 from .conversation_agent import ConversationAgent  
 from .content_agent import ContentAgent
@@ -46,6 +51,10 @@ class OrchestratorAgent:
         self.break_suggestion_threshold = 30 * 60  # 30 minutes in seconds
         self.max_interactions_per_hour = 60  # interactions per hour limit
         
+        # Per-user memory context, reused across turns until it goes stale
+        self.memory_context_ttl = 60  # seconds
+        self._memory_context_cache = TTLCache(maxsize=10_000, ttl=self.memory_context_ttl)
+        
         logger.info("Enhanced Orchestrator Agent with Memory & Telemetry initialized successfully")
     
     def _is_mic_locked(self, session_id: str) -> bool:
@@ -57,17 +66,17 @@ class OrchestratorAgent:
         if not mic_locked_until:
             return False
         
-        return datetime.utcnow() < mic_locked_until
+        return time.monotonic() < mic_locked_until
     
     def _lock_microphone(self, session_id: str) -> None:
         """Lock microphone for specified duration"""
         if session_id not in self.session_store:
             self.session_store[session_id] = {}
         
-        lock_until = datetime.utcnow() + timedelta(seconds=self.mic_lock_duration)
-        self.session_store[session_id]['mic_locked_until'] = lock_until
+        # Monotonic deadline: cheap to check every turn and immune to wall-clock jumps
+        self.session_store[session_id]['mic_locked_until'] = time.monotonic() + self.mic_lock_duration
         
-        logger.info(f"Microphone locked for session {session_id} until {lock_until}")
+        logger.info(f"Microphone locked for session {session_id} for {self.mic_lock_duration}s")
     
     async def _get_conversation_context(self, session_id: str) -> List[Dict[str, Any]]:
         """Get recent conversation context for a session"""
@@ -80,7 +89,7 @@ class OrchestratorAgent:
                 history = self.session_store.get(session_id, {}).get('conversation_history', [])
             
             # Return last 5 exchanges for context
-            return history[-5:] if history else []
+            return list(itertools.islice(history, max(0, len(history) - 5), None))
         except Exception as e:
             logger.error(f"Error getting conversation context: {str(e)}")
             return []
@@ -91,9 +100,16 @@ class OrchestratorAgent:
             if user_id == 'unknown':
                 return {}
             
+            # Snapshots change at most daily, so skip the lookup on every turn of a chat
+            cached = self._memory_context_cache.get(user_id)
+            if cached is not None:
+                return cached
+            
             # Get user memory from memory agent using the correct method
             memory_data = await self.memory_agent.get_user_memory_context(user_id, days=7)
-            return memory_data if memory_data else {}
+            memory_data = memory_data if memory_data else {}
+            self._memory_context_cache[user_id] = memory_data
+            return memory_data
         except Exception as e:
             logger.error(f"Error getting memory context: {str(e)}")
             return {}
@@ -105,13 +121,15 @@ class OrchestratorAgent:
             if user_id == 'unknown':
                 user_id = user_profile.get('id', 'unknown')  # Try alternative key
             
+            timestamp = datetime.now().isoformat()
+            
             if user_id != 'unknown':
                 # Store interaction in memory using the correct method
                 interaction_data = {
                     'user_input': user_input,
                     'ai_response': bot_response,
                     'interaction_type': 'text',
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                     'user_id': user_id,
                     'session_id': session_id
                 }
@@ -122,19 +140,15 @@ class OrchestratorAgent:
                 self.session_store[session_id] = {}
             
             if 'conversation_history' not in self.session_store[session_id]:
-                self.session_store[session_id]['conversation_history'] = []
+                # Keep only last 20 exchanges (20 exchanges = 40 messages)
+                self.session_store[session_id]['conversation_history'] = collections.deque(maxlen=40)
             
             # Store with consistent format for context retrieval
             self.session_store[session_id]['conversation_history'].extend([
-                {'role': 'user', 'sender': 'user', 'text': user_input, 'timestamp': datetime.now().isoformat()},
-                {'role': 'assistant', 'sender': 'bot', 'text': bot_response, 'timestamp': datetime.now().isoformat()}
+                {'role': 'user', 'sender': 'user', 'text': user_input, 'timestamp': timestamp},
+                {'role': 'assistant', 'sender': 'bot', 'text': bot_response, 'timestamp': timestamp}
             ])
             
-            # Keep only last 20 exchanges
-            history = self.session_store[session_id]['conversation_history']
-            if len(history) > 40:  # 20 exchanges = 40 messages
-                self.session_store[session_id]['conversation_history'] = history[-40:]
-            
             logger.info(f"Updated conversation history for session {session_id}: {len(self.session_store[session_id]['conversation_history'])} messages")
                 
         except Exception as e:
@@ -915,7 +929,7 @@ class OrchestratorAgent:
             
             # Step 3: Get conversation context and memory
             context = await self._get_conversation_context(session_id)
-            memory_context = await self._get_memory_context(user_profile.get('user_id', 'unknown'))
+            memory_context = await self._get_memory_context(user_profile.get('id', 'unknown'))
             
             # Step 4: Generate response with full context
             response = await self.conversation_agent.generate_response_with_dialogue_plan(
@@ -966,7 +980,7 @@ class OrchestratorAgent:
             
             # Step 2: Get conversation context and memory
             context = await self._get_conversation_context(session_id)
-            memory_context = await self._get_memory_context(user_profile.get('user_id', 'unknown'))
+            memory_context = await self._get_memory_context(user_profile.get('id', 'unknown'))
             
             # Step 3: Generate response with full context
             response = await self.conversation_agent.generate_response_with_dialogue_plan(
@@ -1036,7 +1050,12 @@ class OrchestratorAgent:
     async def generate_daily_memory_snapshot(self, user_id: str) -> Dict[str, Any]:
         """Generate daily memory snapshot for a user"""
         try:
-            return await self.memory_agent.generate_daily_memory_snapshot(user_id)
+            self._memory_context_cache.pop(user_id, None)
+            try:
+                return await self.memory_agent.generate_daily_memory_snapshot(user_id)
+            finally:
+                # A turn running during generation may have re-cached the old context
+                self._memory_context_cache.pop(user_id, None)
         except Exception as e:
             logger.error(f"Error generating daily memory snapshot: {str(e)}")
             return {"user_id": user_id, "error": str(e)}
@@ -8,20 +8,36 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Inappropriate and too-advanced topic terms, each fused into a single compiled
+# alternation so a transcript is scanned once instead of once per pattern
+_INAPPROPRIATE_RE = re.compile(
+    r'\b(?:'
+    r'violence|violent|fight|hurt|kill|death|die|blood'
+    r'|scary|frightening|terrifying|nightmare|monster'
+    r'|adult|grown.up|inappropriate|sexual|romantic'
+    r'|weapon|gun|knife|sword|bomb'
+    r'|drug|alcohol|cigarette|smoke'
+    r'|hate|stupid|dumb|idiot|bad words'
+    r')\b'
+)
+
+_COMPLEX_TOPIC_RES = {
+    "toddler": re.compile(
+        r'\b(?:complex|complicated|difficult|advanced'
+        r'|chemistry|physics|biology|calculus'
+        r'|politics|government|election|voting)\b'
+    ),
+    "child": re.compile(
+        r'\b(?:quantum|molecular|cellular|atomic'
+        r'|philosophical|existential|metaphysical'
+        r'|advanced mathematics|calculus|trigonometry)\b'
+    ),
+}
+
 class SafetyAgent:
     """Handles content safety and moderation for children"""
     
     def __init__(self):
-        # Inappropriate content patterns
-        self.inappropriate_patterns = [
-            r'\b(violence|violent|fight|hurt|kill|death|die|blood)\b',
-            r'\b(scary|frightening|terrifying|nightmare|monster)\b',
-            r'\b(adult|grown.up|inappropriate|sexual|romantic)\b',
-            r'\b(weapon|gun|knife|sword|bomb)\b',
-            r'\b(drug|alcohol|cigarette|smoke)\b',
-            r'\b(hate|stupid|dumb|idiot|bad words)\b'
-        ]
-        
         # Age-appropriate topics
         self.age_appropriate_topics = {
             "toddler": [
@@ -53,13 +69,11 @@ class SafetyAgent:
             # Check for inappropriate patterns
             content_lower = content.lower()
             
-            for pattern in self.inappropriate_patterns:
-                if re.search(pattern, content_lower):
-                    safety_result["is_safe"] = False
-                    safety_result["reason"] = f"Content contains inappropriate material for age {age}"
-                    safety_result["suggested_alternative"] = self._get_alternative_topic(age)
-                    safety_result["confidence"] = 0.9
-                    break
+            if _INAPPROPRIATE_RE.search(content_lower):
+                safety_result["is_safe"] = False
+                safety_result["reason"] = f"Content contains inappropriate material for age {age}"
+                safety_result["suggested_alternative"] = self._get_alternative_topic(age)
+                safety_result["confidence"] = 0.9
             
             # Age-specific checks
             if safety_result["is_safe"]:
@@ -76,29 +90,13 @@ class SafetyAgent:
         """Check if content is appropriate for age group"""
         content_lower = content.lower()
         
-        # Complex topic patterns for different age groups
-        complex_patterns = {
-            "toddler": [
-                r'\b(complex|complicated|difficult|advanced)\b',
-                r'\b(chemistry|physics|biology|calculus)\b',
-                r'\b(politics|government|election|voting)\b'
-            ],
-            "child": [
-                r'\b(quantum|molecular|cellular|atomic)\b',
-                r'\b(philosophical|existential|metaphysical)\b',
-                r'\b(advanced mathematics|calculus|trigonometry)\b'
-            ]
-        }
+        pattern = _COMPLEX_TOPIC_RES.get(age_group)
         
-        patterns = complex_patterns.get(age_group, [])
-        
-        for pattern in patterns:
-            if re.search(pattern, content_lower):
-                safety_result["is_safe"] = False
-                safety_result["reason"] = f"Content too advanced for {age_group}"
-                safety_result["suggested_alternative"] = self._get_alternative_topic_by_age_group(age_group)
-                safety_result["confidence"] = 0.8
-                break
+        if pattern is not None and pattern.search(content_lower):
+            safety_result["is_safe"] = False
+            safety_result["reason"] = f"Content too advanced for {age_group}"
+            safety_result["suggested_alternative"] = self._get_alternative_topic_by_age_group(age_group)
+            safety_result["confidence"] = 0.8
         
         return safety_result
     
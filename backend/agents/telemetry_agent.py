@@ -265,8 +265,8 @@ class TelemetryAgent:
         """Get feature flags for a user"""
         try:
             # Get user profile
-            user_profile = await self.db.user_profiles.find_one({"id": user_id})
-            if not user_profile:
+            user_profile = await self.db.user_profiles.find_one({"id": user_id}, {"flags": 1, "_id": 0})
+            if user_profile is None:
                 return self.default_flags
             
             # Get user-specific flags
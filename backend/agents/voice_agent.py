@@ -2,36 +2,123 @@
 Voice Agent - Simplified Speech-to-Text and Text-to-Speech using Deepgram REST API
 """
 import asyncio
+import functools
+import io
 import logging
-import base64
+import wave
+import numpy as np
 import requests
 import re
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+
+# SIMD base64 for TTS audio when available; same API as the stdlib
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
 
 logger = logging.getLogger(__name__)
 
+# Long replies are split into chunks; this many are synthesized at once
+_TTS_CHUNK_CONCURRENCY = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """Process-wide HTTP session so Deepgram calls reuse warm TCP+TLS connections"""
+    session = requests.Session()
+    # Calls run on the default executor, so size the pool for concurrent worker threads
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=64))
+    return session
+
+
+# Voice personality -> Deepgram Aura 2 voice settings
+_VOICE_PERSONALITIES = MappingProxyType({
+    "friendly_companion": MappingProxyType({
+        "model": "aura-2-amalthea-en",
+    }),
+    "story_narrator": MappingProxyType({
+        "model": "aura-2-amalthea-en",
+    }),
+    "learning_buddy": MappingProxyType({
+        "model": "aura-2-amalthea-en",
+    })
+})
+
+# Common child speech corrections
+_CHILD_CORRECTIONS = MappingProxyType({
+    "twy": "try",
+    "fwee": "free",
+    "bwue": "blue",
+    "gweat": "great",
+    "pwease": "please",
+    "wove": "love",
+    "vewy": "very",
+    "widdle": "little",
+    "wight": "right",
+    "weally": "really"
+})
+_CHILD_CORRECTIONS_RE = re.compile(
+    r"(?<![\w'])(" + "|".join(_CHILD_CORRECTIONS) + r")(?![\w'])", re.IGNORECASE
+)
+
+
+def _correct_child_word(match: re.Match) -> str:
+    """Replace one matched child-speech word, preserving its capitalization"""
+    word = match.group(0)
+    corrected_word = _CHILD_CORRECTIONS[word.lower()]
+    return corrected_word.capitalize() if word[0].isupper() else corrected_word
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_voice(personality: str) -> Mapping[str, Any]:
+    """Resolve a personality to its read-only voice config, falling back to the default"""
+    return _VOICE_PERSONALITIES.get(personality, _VOICE_PERSONALITIES["friendly_companion"])
+
+
+def _pcm16_to_mulaw(pcm: bytes) -> bytes:
+    """Encode little-endian 16-bit PCM as 8-bit G.711 mu-law (bit-exact with audioop.lin2ulaw)"""
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.int32) >> 2
+    mask = np.where(samples < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(samples), 8158) + 0x21
+    segment = np.maximum(np.floor(np.log2(np.maximum(magnitude >> 5, 1))).astype(np.int32), 0)
+    mulaw = ((segment << 4) | ((magnitude >> (segment + 1)) & 0x0F)) ^ mask
+    return mulaw.astype(np.uint8).tobytes()
+
 
 class VoiceAgent:
     """Simplified voice processing with Deepgram Nova 3 STT and Aura 2 TTS using REST API"""
     
-    def __init__(self, deepgram_api_key: str):
+    def __init__(self, deepgram_api_key: str, low_bandwidth_mode: bool = False):
         self.api_key = deepgram_api_key
+        # Halve STT upload size by sending PCM WAV input to Deepgram as 8-bit mu-law
+        self.low_bandwidth_mode = low_bandwidth_mode
         self.base_url = "https://api.deepgram.com/v1"
-        self.voice_personalities = {
-            "friendly_companion": {
-                "model": "aura-2-amalthea-en",
-            },
-            "story_narrator": {
-                "model": "aura-2-amalthea-en",
-            },
-            "learning_buddy": {
-                "model": "aura-2-amalthea-en",
-            }
-        }
+        self.http = _get_http_session()
+        self.voice_personalities = _VOICE_PERSONALITIES
         
         logger.info("Voice Agent initialized with simplified Deepgram REST API")
 
+    def _encode_low_bandwidth(self, audio_data: bytes) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """Re-encode 16-bit PCM WAV as raw mu-law, returning the payload and its Deepgram params"""
+        try:
+            with wave.open(io.BytesIO(audio_data)) as wav:
+                if wav.getsampwidth() != 2 or wav.getcomptype() != "NONE":
+                    return None
+                pcm = wav.readframes(wav.getnframes())
+                params = {
+                    "encoding": "mulaw",
+                    "sample_rate": str(wav.getframerate()),
+                    "channels": str(wav.getnchannels()),
+                }
+        except (wave.Error, EOFError):
+            return None
+        
+        return _pcm16_to_mulaw(pcm), params
+
     async def speech_to_text(self, audio_data: bytes, enhanced_for_children: bool = True) -> Optional[str]:
         """Convert speech to text using Deepgram Nova 3 REST API with enhanced child speech recognition"""
         try:
@@ -67,13 +154,20 @@ class VoiceAgent:
                 "punctuate": "true",
             }
             
+            if self.low_bandwidth_mode and content_type == "audio/wav":
+                encoded = self._encode_low_bandwidth(audio_data)
+                if encoded:
+                    audio_data, raw_params = encoded
+                    params.update(raw_params)
+                    content_type = headers["Content-Type"] = "application/octet-stream"
+            
             logger.info(f"Making STT request to Deepgram: {len(audio_data)} bytes, Content-Type: {content_type}")
             
             # Make REST API call using requests in async context
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: requests.post(
+                lambda: self.http.post(
                     f"{self.base_url}/listen",
                     headers=headers,
                     params=params,
@@ -122,41 +216,9 @@ class VoiceAgent:
         """Enhance transcript for common child speech patterns"""
         if not transcript:
             return transcript
-            
-        # Common child speech corrections
-        corrections = {
-            "twy": "try",
-            "fwee": "free", 
-            "bwue": "blue",
-            "gweat": "great",
-            "pwease": "please",
-            "wove": "love",
-            "vewy": "very",
-            "widdle": "little",
-            "wight": "right",
-            "weally": "really"
-        }
-        
-        words = transcript.split()
-        corrected_words = []
         
-        for word in words:
-            word_lower = word.lower().strip('.,!?')
-            if word_lower in corrections:
-                corrected_word = corrections[word_lower]
-                # Preserve original capitalization and punctuation
-                if word[0].isupper():
-                    corrected_word = corrected_word.capitalize()
-                # Add back punctuation
-                for punct in '.,!?':
-                    if word.endswith(punct):
-                        corrected_word += punct
-                        break
-                corrected_words.append(corrected_word)
-            else:
-                corrected_words.append(word)
-        
-        return ' '.join(corrected_words)
+        # One regex pass over the transcript; surrounding punctuation is left in place
+        return _CHILD_CORRECTIONS_RE.sub(_correct_child_word, transcript)
     
     async def text_to_speech_chunked(self, text: str, personality: str = "friendly_companion", max_chunk_size: int = 1500) -> Optional[str]:
         """Convert long text to speech by chunking into smaller pieces and concatenating audio"""
@@ -171,30 +233,29 @@ class VoiceAgent:
             chunks = self._split_text_into_chunks(text, max_chunk_size)
             logger.info(f"Split into {len(chunks)} chunks")
             
-            audio_chunks = []
+            # Synthesize chunks concurrently, capped to stay under Deepgram rate limits
+            limiter = asyncio.Semaphore(_TTS_CHUNK_CONCURRENCY)
             
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Processing chunk {i+1}/{len(chunks)}: {chunk[:50]}...")
-                
-                # Get audio for this chunk
-                chunk_audio = await self.text_to_speech(chunk.strip(), personality)
-                
-                if chunk_audio:
-                    audio_chunks.append(chunk_audio)
-                    # Small delay between chunks to avoid rate limiting
-                    await asyncio.sleep(0.1)
-                else:
+            async def synthesize(i: int, chunk: str) -> Optional[bytes]:
+                async with limiter:
+                    logger.info(f"Processing chunk {i+1}/{len(chunks)}: {chunk[:50]}...")
+                    chunk_audio = await self.text_to_speech_binary(chunk.strip(), personality)
+                if not chunk_audio:
                     logger.warning(f"Failed to generate audio for chunk {i+1}")
+                return chunk_audio
+            
+            results = await asyncio.gather(*(synthesize(i, chunk) for i, chunk in enumerate(chunks)))
+            audio_chunks = [audio for audio in results if audio]
             
             if not audio_chunks:
                 logger.error("No audio chunks generated")
                 return None
             
-            # Concatenate all audio chunks
+            # Concatenate all audio chunks in reply order, then encode once for the client
             concatenated_audio = self._concatenate_audio_chunks(audio_chunks)
             
             logger.info(f"Successfully concatenated {len(audio_chunks)} audio chunks")
-            return concatenated_audio
+            return b64encode(concatenated_audio).decode('ascii')
             
         except Exception as e:
             logger.error(f"Chunked TTS error: {str(e)}")
@@ -229,27 +290,26 @@ class VoiceAgent:
         
         return chunks
     
-    def _concatenate_audio_chunks(self, audio_chunks: List[str]) -> str:
-        """Concatenate base64 audio chunks"""
-        try:
-            # For simplicity, we'll just return the first chunk for now
-            # In a full implementation, you'd need to decode, concatenate the raw audio, and re-encode
-            # This is complex as it requires audio processing libraries
-            
-            # For now, return the longest chunk as a fallback
-            longest_chunk = max(audio_chunks, key=len) if audio_chunks else ""
-            logger.info(f"Using longest chunk ({len(longest_chunk)} chars) as fallback")
-            return longest_chunk
-            
-        except Exception as e:
-            logger.error(f"Audio concatenation error: {str(e)}")
-            return audio_chunks[0] if audio_chunks else ""
+    def _concatenate_audio_chunks(self, audio_chunks: List[bytes]) -> bytes:
+        """Concatenate raw audio chunks in order"""
+        # Aura's default MP3 output is a bare frame stream with no container header,
+        # so joined chunks play back as one continuous clip
+        return b"".join(audio_chunks)
 
     async def text_to_speech(self, text: str, personality: str = "friendly_companion") -> Optional[str]:
-        """Convert text to speech using Deepgram Aura 2 REST API"""
+        """Convert text to speech using Deepgram Aura 2 REST API, base64-encoded for JSON clients"""
+        audio_data = await self.text_to_speech_binary(text, personality)
+        if audio_data is None:
+            return None
+        
+        # Convert to base64 for frontend
+        return b64encode(audio_data).decode('ascii')
+    
+    async def text_to_speech_binary(self, text: str, personality: str = "friendly_companion") -> Optional[bytes]:
+        """Convert text to speech using Deepgram Aura 2 REST API, returning the raw audio bytes"""
         try:
             # Get voice configuration
-            voice_config = self.voice_personalities.get(personality, self.voice_personalities["friendly_companion"])
+            voice_config = _resolve_voice(personality)
             
             # Prepare headers
             headers = {
@@ -273,7 +333,7 @@ class VoiceAgent:
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
                 None,
-                lambda: requests.post(
+                lambda: self.http.post(
                     f"{self.base_url}/speak",
                     headers=headers,
                     params=params,
@@ -284,11 +344,8 @@ class VoiceAgent:
             
             if response.status_code == 200:
                 audio_data = response.content
-                # Convert to base64 for frontend
-                audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-                
-                logger.info(f"TTS successful, audio size: {len(audio_base64)} chars")
-                return audio_base64
+                logger.info(f"TTS successful, audio size: {len(audio_data)} bytes")
+                return audio_data
             else:
                 logger.error(f"TTS API error: {response.status_code} - {response.text}")
                 return None
@@ -297,6 +354,11 @@ class VoiceAgent:
             logger.error(f"TTS error: {str(e)}")
             return None
     
+    async def text_to_speech_with_prosody(self, text: str, personality: str = "friendly_companion", prosody: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Convert text to speech for a dialogue turn carrying prosody hints"""
+        # Aura 2 has no SSML controls, so the resolved personality voice is used as-is
+        return await self.text_to_speech(text, personality)
+    
     def get_available_voices(self) -> Dict[str, Any]:
         """Get available voice personalities"""
         return {
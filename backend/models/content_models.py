@@ -1,17 +1,25 @@
 """
 Content Models - Stories, Songs, Rhymes, Games, Educational Content
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import uuid
+from enum import StrEnum
+
+from .ids import new_id
+
+class AgeGroup(StrEnum):
+    """Age groups content can target"""
+    TODDLER = "toddler"
+    CHILD = "child"
+    PRETEEN = "preteen"
 
 class ContentBase(BaseModel):
     """Base content model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     title: str
     content: str
-    age_group: str  # toddler, child, preteen
+    age_group: AgeGroup
     language: str = "english"
     tags: List[str] = []
     difficulty_level: int = 1  # 1-5 scale
@@ -20,14 +28,8 @@ class ContentBase(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
-    @validator('age_group')
-    def validate_age_group(cls, v):
-        valid_groups = ['toddler', 'child', 'preteen']
-        if v not in valid_groups:
-            raise ValueError(f'Age group must be one of: {valid_groups}')
-        return v
-    
-    @validator('difficulty_level')
+    @field_validator('difficulty_level')
+    @classmethod
     def validate_difficulty(cls, v):
         if v < 1 or v > 5:
             raise ValueError('Difficulty level must be between 1 and 5')
@@ -76,7 +78,7 @@ class ContentCreate(BaseModel):
     title: str
     content: str
     content_type: str  # story, song, rhyme, game, educational
-    age_group: str
+    age_group: AgeGroup
     language: str = "english"
     tags: List[str] = []
     difficulty_level: int = 1
@@ -86,7 +88,7 @@ class ContentUpdate(BaseModel):
     """Content update model"""
     title: Optional[str] = None
     content: Optional[str] = None
-    age_group: Optional[str] = None
+    age_group: Optional[AgeGroup] = None
     language: Optional[str] = None
     tags: Optional[List[str]] = None
     difficulty_level: Optional[int] = None
@@ -1,17 +1,25 @@
 """
 Conversation and Session Models
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import uuid
+from enum import StrEnum
+
+from .ids import new_id
+
+class MessageType(StrEnum):
+    """Kinds of conversation message"""
+    USER_TEXT = "user_text"
+    USER_VOICE = "user_voice"
+    AI_RESPONSE = "ai_response"
 
 class ConversationMessage(BaseModel):
     """Individual conversation message"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     session_id: str
     user_id: str
-    message_type: str  # 'user_text', 'user_voice', 'ai_response'
+    message_type: MessageType
     content: str
     audio_base64: Optional[str] = None
     metadata: Dict[str, Any] = {}
@@ -21,7 +29,9 @@ class ConversationMessage(BaseModel):
 
 class ConversationSession(BaseModel):
     """Conversation session model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: str = Field(default_factory=new_id)
     user_id: str
     session_name: str = "Chat Session"
     started_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,36 @@
+"""
+ID generation shared by the data models
+"""
+import os
+import threading
+
+_ID_BYTES = 16
+_BATCH_SIZE = 256
+
+
+class _IdPool:
+    """Hands out UUID4-formatted ids carved from one batched os.urandom read"""
+
+    def __init__(self, batch_size: int = _BATCH_SIZE):
+        self._batch_size = batch_size
+        self._buf = b''
+        self._i = 0
+        self._lock = threading.Lock()
+
+    def next(self) -> str:
+        with self._lock:
+            if self._i >= len(self._buf):
+                self._buf = os.urandom(_ID_BYTES * self._batch_size)
+                self._i = 0
+            raw = bytearray(self._buf[self._i:self._i + _ID_BYTES])
+            self._i += _ID_BYTES
+
+        # Stamp the version 4 / RFC 4122 variant bits so ids stay valid UUIDs
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        h = raw.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+_ID_POOL = _IdPool()
+new_id = _ID_POOL.next
@@ -1,38 +1,42 @@
 """
 User and Profile Models
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import uuid
+from enum import StrEnum
+
+from .ids import new_id
+
+class VoicePersonality(StrEnum):
+    """Voice personalities offered by the voice agent"""
+    FRIENDLY_COMPANION = "friendly_companion"
+    STORY_NARRATOR = "story_narrator"
+    LEARNING_BUDDY = "learning_buddy"
 
 class UserProfile(BaseModel):
     """User profile model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: str = Field(default_factory=new_id)
     name: str
     age: int
     location: str
     timezone: str = "UTC"
     language: str = "english"
-    voice_personality: str = "friendly_companion"
+    voice_personality: VoicePersonality = VoicePersonality.FRIENDLY_COMPANION
     interests: List[str] = []
     learning_goals: List[str] = []
     parent_email: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
-    @validator('age')
+    @field_validator('age')
+    @classmethod
     def validate_age(cls, v):
         if v < 3 or v > 12:
             raise ValueError('Age must be between 3 and 12')
         return v
-    
-    @validator('voice_personality')
-    def validate_voice_personality(cls, v):
-        valid_personalities = ['friendly_companion', 'story_narrator', 'learning_buddy']
-        if v not in valid_personalities:
-            raise ValueError(f'Voice personality must be one of: {valid_personalities}')
-        return v
 
 class UserProfileCreate(BaseModel):
     """User profile creation model"""
@@ -41,7 +45,7 @@ class UserProfileCreate(BaseModel):
     location: str
     timezone: str = "UTC"
     language: str = "english"
-    voice_personality: str = "friendly_companion"
+    voice_personality: VoicePersonality = VoicePersonality.FRIENDLY_COMPANION
     interests: List[str] = []
     learning_goals: List[str] = []
     parent_email: Optional[str] = None
@@ -53,14 +57,14 @@ class UserProfileUpdate(BaseModel):
     location: Optional[str] = None
     timezone: Optional[str] = None
     language: Optional[str] = None
-    voice_personality: Optional[str] = None
+    voice_personality: Optional[VoicePersonality] = None
     interests: Optional[List[str]] = None
     learning_goals: Optional[List[str]] = None
     parent_email: Optional[str] = None
 
 class ParentalControls(BaseModel):
     """Parental controls model"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     user_id: str
     time_limits: Dict[str, int] = {}  # day: minutes
     content_restrictions: List[str] = []
@@ -1,19 +1,22 @@
 """
 AI Companion Device Backend - Multi-Agent Architecture
 """
-from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Form, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, WriteConcern
 from dotenv import load_dotenv
 import os
+import asyncio
 import logging
 from pathlib import Path
-import base64
-import json
-from typing import Dict, List, Any
-from datetime import datetime
+import orjson
+import struct
+from typing import Dict, List, Any, Optional
+from datetime import datetime, timedelta, timezone
 import time
+from cachetools import TTLCache
 
 # Import models
 from models.user_models import UserProfile, UserProfileCreate, UserProfileUpdate, ParentalControls, ParentalControlsCreate, ParentalControlsUpdate
@@ -39,6 +42,7 @@ MONGO_URL = os.environ.get('MONGO_URL')
 DB_NAME = os.environ.get('DB_NAME')
 GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
 DEEPGRAM_API_KEY = os.environ.get('DEEPGRAM_API_KEY')
+CORS_ORIGINS = [origin.strip() for origin in os.environ.get('CORS_ORIGINS', '*').split(',') if origin.strip()]
 
 # Validate API keys
 if not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_key_here":
@@ -46,15 +50,33 @@ if not GEMINI_API_KEY or GEMINI_API_KEY == "your_gemini_key_here":
 if not DEEPGRAM_API_KEY or DEEPGRAM_API_KEY == "your_deepgram_key_here":
     logger.warning("DEEPGRAM_API_KEY not set properly. Please add your key to .env file.")
 
-# MongoDB connection
-client = AsyncIOMotorClient(MONGO_URL)
+# SIMD base64 for audio payloads when available; same API as the stdlib
+try:
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+# MongoDB connection, pool sized per worker process
+client = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', 50)),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', 10)),
+    maxIdleTimeMS=60_000,
+    # Fail fast instead of stalling handlers for the 30s default when Mongo is unreachable
+    serverSelectionTimeoutMS=int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', 3_000)),
+    retryWrites=True,
+    # Wire compression; the server picks the first one it also supports
+    compressors=os.environ.get('MONGO_COMPRESSORS', 'zstd,zlib'),
+    zlibCompressionLevel=6
+)
 db = client[DB_NAME]
 
 # Create FastAPI app
 app = FastAPI(
     title="AI Companion Device API",
     description="Multi-agent AI companion system for children",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Create API router
@@ -63,6 +85,70 @@ api_router = APIRouter(prefix="/api")
 # Initialize orchestrator agent
 orchestrator = None
 
+def get_orchestrator() -> OrchestratorAgent:
+    """Dependency returning the initialized orchestrator, or 503 while it is unavailable"""
+    if orchestrator is None:
+        raise HTTPException(status_code=503, detail="Multi-agent system not initialized")
+    return orchestrator
+
+# Short-lived cache of user profile documents keyed by user id. It is per process
+# and only invalidated by writes in this process, so it is disabled whenever
+# gunicorn runs more than one worker (WEB_CONCURRENCY > 1)
+_profile_cache = TTLCache(maxsize=10_000, ttl=60)
+_PROFILE_CACHE_ENABLED = int(os.environ.get("WEB_CONCURRENCY", "1")) <= 1
+# Bumped on every profile write; reads that straddle a write don't cache what they saw
+_profile_epoch = 0
+
+# Shared fields of the profile used when an unknown user starts talking
+_DEFAULT_PROFILE_TEMPLATE = {
+    "name": "Test User",
+    "age": 7,
+    "language": "english",
+    "voice_personality": "friendly_companion"
+}
+_DEFAULT_PREFERENCES = {
+    "voice_personality": "friendly_companion",
+    "learning_goals": ["general_knowledge"],
+    "favorite_topics": []
+}
+
+def _default_profile(user_id: str) -> Dict[str, Any]:
+    """Build a fresh default profile for a user without a stored one"""
+    now = datetime.now(timezone.utc)
+    return {
+        **_DEFAULT_PROFILE_TEMPLATE,
+        "id": user_id,
+        "user_id": user_id,  # Add both for compatibility
+        "preferences": {
+            **_DEFAULT_PREFERENCES,
+            "learning_goals": list(_DEFAULT_PREFERENCES["learning_goals"]),
+            "favorite_topics": []
+        },
+        "created_at": now,
+        "updated_at": now
+    }
+
+async def get_profile_cached(user_id: str):
+    """Get a user profile document, serving repeat reads from the TTL cache"""
+    if not _PROFILE_CACHE_ENABLED:
+        return await db.user_profiles.find_one({"id": user_id}, {"_id": 0})
+    profile = _profile_cache.get(user_id)
+    if profile is None:
+        epoch = _profile_epoch
+        profile = await db.user_profiles.find_one({"id": user_id}, {"_id": 0})
+        if profile is not None and epoch == _profile_epoch:
+            _profile_cache[user_id] = profile
+    return profile
+
+def _profile_written(user_id: str, profile: Optional[Dict[str, Any]] = None):
+    """Record a completed write to a user's profile, caching the new document if the writer has it"""
+    global _profile_epoch
+    _profile_epoch += 1
+    if profile is not None and _PROFILE_CACHE_ENABLED:
+        _profile_cache[user_id] = profile
+    else:
+        _profile_cache.pop(user_id, None)
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the multi-agent system"""
@@ -75,31 +161,47 @@ async def startup_event():
         )
         logger.info("Multi-agent system initialized successfully")
         
+        # Voice personalities are static per process, so serialize them once
+        app.state.personalities_body = orjson.dumps(orchestrator.voice_agent.get_available_voices())
+        
+        # Make sure hot lookup fields are indexed
+        await ensure_indexes()
+        
         # Initialize default content if database is empty
         await init_default_content()
         
     except Exception as e:
         logger.error(f"Failed to initialize multi-agent system: {str(e)}")
 
+# Default parental controls for new profiles; pydantic copies these on construct
+_DEFAULT_TIME_LIMITS = {"monday": 60, "tuesday": 60, "wednesday": 60, "thursday": 60, "friday": 60, "saturday": 90, "sunday": 90}
+_DEFAULT_ALLOWED_TYPES = ("story", "song", "rhyme", "educational")
+_DEFAULT_QUIET_HOURS = {"start": "20:00", "end": "07:00"}
+_DEFAULT_NOTIFICATIONS = {"activity_summary": True, "safety_alerts": True}
+
 # User Profile Management
 @api_router.post("/users/profile", response_model=UserProfile)
 async def create_user_profile(profile_data: UserProfileCreate):
     """Create a new user profile"""
     try:
-        profile = UserProfile(**profile_data.dict())
-        await db.user_profiles.insert_one(profile.dict())
-        
+        profile = UserProfile.model_validate(profile_data)
         # Create default parental controls
         parental_controls = ParentalControls(
             user_id=profile.id,
-            time_limits={"monday": 60, "tuesday": 60, "wednesday": 60, "thursday": 60, "friday": 60, "saturday": 90, "sunday": 90},
+            time_limits=_DEFAULT_TIME_LIMITS,
             content_restrictions=[],
-            allowed_content_types=["story", "song", "rhyme", "educational"],
-            quiet_hours={"start": "20:00", "end": "07:00"},
+            allowed_content_types=_DEFAULT_ALLOWED_TYPES,
+            quiet_hours=_DEFAULT_QUIET_HOURS,
             monitoring_enabled=True,
-            notification_preferences={"activity_summary": True, "safety_alerts": True}
+            notification_preferences=_DEFAULT_NOTIFICATIONS
+        )
+        
+        # Both documents are independent, so write them concurrently
+        await asyncio.gather(
+            db.user_profiles.insert_one(profile.model_dump()),
+            db.parental_controls.insert_one(parental_controls.model_dump())
         )
-        await db.parental_controls.insert_one(parental_controls.dict())
+        _profile_written(profile.id)
         
         logger.info(f"Created user profile: {profile.id}")
         return profile
@@ -112,7 +214,7 @@ async def create_user_profile(profile_data: UserProfileCreate):
 async def get_user_profile(user_id: str):
     """Get user profile by ID"""
     try:
-        profile = await db.user_profiles.find_one({"id": user_id})
+        profile = await get_profile_cached(user_id)
         if not profile:
             raise HTTPException(status_code=404, detail="User profile not found")
         
@@ -128,18 +230,20 @@ async def get_user_profile(user_id: str):
 async def update_user_profile(user_id: str, profile_data: UserProfileUpdate):
     """Update user profile"""
     try:
-        update_data = {k: v for k, v in profile_data.dict().items() if v is not None}
-        update_data["updated_at"] = datetime.utcnow()
+        update_data = profile_data.model_dump(exclude_unset=True, exclude_none=True)
+        update_data["updated_at"] = datetime.now(timezone.utc)
         
-        result = await db.user_profiles.update_one(
+        updated_profile = await db.user_profiles.find_one_and_update(
             {"id": user_id},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
         )
+        _profile_written(user_id, updated_profile)
         
-        if result.matched_count == 0:
+        if updated_profile is None:
             raise HTTPException(status_code=404, detail="User profile not found")
         
-        updated_profile = await db.user_profiles.find_one({"id": user_id})
         return UserProfile(**updated_profile)
         
     except HTTPException:
@@ -154,18 +258,17 @@ async def delete_user_profile(user_id: str):
     try:
         # Delete user profile
         profile_result = await db.user_profiles.delete_one({"id": user_id})
+        _profile_written(user_id)
         
         if profile_result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="User profile not found")
         
-        # Delete associated parental controls
-        await db.parental_controls.delete_many({"user_id": user_id})
-        
-        # Delete conversation sessions
-        await db.conversation_sessions.delete_many({"user_id": user_id})
-        
-        # Delete memory snapshots
-        await db.memory_snapshots.delete_many({"user_id": user_id})
+        # Delete associated parental controls, conversation sessions and memory snapshots
+        await asyncio.gather(
+            db.parental_controls.delete_many({"user_id": user_id}),
+            db.conversation_sessions.delete_many({"user_id": user_id}),
+            db.memory_snapshots.delete_many({"user_id": user_id})
+        )
         
         logger.info(f"Successfully deleted user profile and all data for user: {user_id}")
         return {"message": "Profile deleted successfully"}
@@ -181,7 +284,7 @@ async def delete_user_profile(user_id: str):
 async def get_parental_controls(user_id: str):
     """Get parental controls for user"""
     try:
-        controls = await db.parental_controls.find_one({"user_id": user_id})
+        controls = await db.parental_controls.find_one({"user_id": user_id}, {"_id": 0})
         if not controls:
             raise HTTPException(status_code=404, detail="Parental controls not found")
         
@@ -197,18 +300,19 @@ async def get_parental_controls(user_id: str):
 async def update_parental_controls(user_id: str, controls_data: ParentalControlsUpdate):
     """Update parental controls"""
     try:
-        update_data = {k: v for k, v in controls_data.dict().items() if v is not None}
-        update_data["updated_at"] = datetime.utcnow()
+        update_data = controls_data.model_dump(exclude_unset=True, exclude_none=True)
+        update_data["updated_at"] = datetime.now(timezone.utc)
         
-        result = await db.parental_controls.update_one(
+        updated_controls = await db.parental_controls.find_one_and_update(
             {"user_id": user_id},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
         )
         
-        if result.matched_count == 0:
+        if updated_controls is None:
             raise HTTPException(status_code=404, detail="Parental controls not found")
         
-        updated_controls = await db.parental_controls.find_one({"user_id": user_id})
         return ParentalControls(**updated_controls)
         
     except HTTPException:
@@ -222,8 +326,8 @@ async def update_parental_controls(user_id: str, controls_data: ParentalControls
 async def create_conversation_session(session_data: ConversationSessionCreate):
     """Create a new conversation session"""
     try:
-        session = ConversationSession(**session_data.dict())
-        await db.conversation_sessions.insert_one(session.dict())
+        session = ConversationSession.model_validate(session_data)
+        await db.conversation_sessions.insert_one(session.model_dump())
         
         logger.info(f"Created conversation session: {session.id}")
         return session
@@ -233,22 +337,19 @@ async def create_conversation_session(session_data: ConversationSessionCreate):
         raise HTTPException(status_code=500, detail="Failed to create conversation session")
 
 @api_router.get("/content/stories", response_model=Dict[str, Any])
-async def get_stories():
+async def get_stories(orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get all available stories"""
     try:
-        stories = await orchestrator.enhanced_content_agent.get_stories()
+        stories = await orch.enhanced_content_agent.get_stories()
         return {"stories": stories}
     except Exception as e:
         logger.error(f"Error fetching stories: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch stories")
 
 @api_router.post("/content/stories/{story_id}/narrate")
-async def narrate_story(story_id: str, request: Dict[str, Any]):
+async def narrate_story(story_id: str, request: Dict[str, Any], orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Narrate a full story without interruptions"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
         user_id = request.get('user_id')
         full_narration = request.get('full_narration', True)
         voice_personality = request.get('voice_personality', 'friendly_companion')
@@ -258,7 +359,7 @@ async def narrate_story(story_id: str, request: Dict[str, Any]):
         
         # Get user profile (create a basic one if needed)
         try:
-            user_profile_doc = await db.user_profiles.find_one({"id": user_id})
+            user_profile_doc = await get_profile_cached(user_id)
             if not user_profile_doc:
                 # Create a basic user profile for story narration
                 user_profile = {
@@ -281,7 +382,7 @@ async def narrate_story(story_id: str, request: Dict[str, Any]):
             }
         
         # Get the story content
-        story = await orchestrator.enhanced_content_agent.get_story_by_id(story_id)
+        story = await orch.enhanced_content_agent.get_story_by_id(story_id)
         if not story:
             raise HTTPException(status_code=404, detail="Story not found")
         
@@ -296,7 +397,7 @@ async def narrate_story(story_id: str, request: Dict[str, Any]):
         
         # Generate the full story narration using chunked TTS for long stories
         session_id = f"story_session_{story_id}_{int(time.time())}"
-        response = await orchestrator.process_text_input(
+        response = await orch.process_text_input(
             session_id=session_id,
             text=narration_prompt,
             user_profile=user_profile,
@@ -324,32 +425,32 @@ async def narrate_story(story_id: str, request: Dict[str, Any]):
 async def process_audio_simple(
     session_id: str = Form(...),
     user_id: str = Form(...),
-    audio_base64: str = Form(...)
+    audio: Optional[UploadFile] = File(None),
+    audio_base64: Optional[str] = Form(None),
+    orch: OrchestratorAgent = Depends(get_orchestrator)
 ):
     """Simplified voice processing - STT + conversation + TTS in one call"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
+        if audio is None and not audio_base64:
+            return JSONResponse(
+                status_code=400,
+                content={"status": "error", "detail": "audio or audio_base64 is required"}
+            )
         
         # Get user profile or create a default one
-        user_profile = await db.user_profiles.find_one({"id": user_id})
+        user_profile = await get_profile_cached(user_id)
         if not user_profile:
             # Create a default profile for testing
-            user_profile = {
-                "id": user_id,
-                "user_id": user_id,
-                "name": "Test User",
-                "age": 7,
-                "preferences": {
-                    "voice_personality": "friendly_companion"
-                }
-            }
+            user_profile = _default_profile(user_id)
         
-        # Decode base64 audio
-        audio_data = base64.b64decode(audio_base64)
+        # Read raw upload bytes directly, decoding base64 only for legacy clients
+        if audio is not None:
+            audio_data = await audio.read()
+        else:
+            audio_data = b64decode(audio_base64)
         
         # Process through orchestrator using existing method
-        result = await orchestrator.process_voice_input(
+        result = await orch.process_voice_input(
             session_id,
             audio_data,
             user_profile
@@ -378,22 +479,19 @@ async def process_audio_simple(
         )
 
 @api_router.post("/conversations/voice", response_model=AIResponse)
-async def process_voice_input(voice_input: VoiceInput):
+async def process_voice_input(voice_input: VoiceInput, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Process voice input through the multi-agent system"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
         # Get user profile
-        user_profile = await db.user_profiles.find_one({"id": voice_input.user_id})
+        user_profile = await get_profile_cached(voice_input.user_id)
         if not user_profile:
             raise HTTPException(status_code=404, detail="User profile not found")
         
         # Decode audio data
-        audio_data = base64.b64decode(voice_input.audio_base64)
+        audio_data = b64decode(voice_input.audio_base64)
         
         # Process through orchestrator
-        result = await orchestrator.process_voice_input(
+        result = await orch.process_voice_input(
             voice_input.session_id,
             audio_data,
             user_profile
@@ -402,12 +500,13 @@ async def process_voice_input(voice_input: VoiceInput):
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         
-        return AIResponse(
-            response_text=result["response_text"],
-            response_audio=result.get("response_audio"),
-            content_type=result.get("content_type", "conversation"),
-            metadata=result.get("metadata", {})
-        )
+        # Plain dict: response_model validates and serializes it once on the way out
+        return {
+            "response_text": result["response_text"],
+            "response_audio": result.get("response_audio"),
+            "content_type": result.get("content_type", "conversation"),
+            "metadata": result.get("metadata", {})
+        }
         
     except HTTPException:
         raise
@@ -415,41 +514,36 @@ async def process_voice_input(voice_input: VoiceInput):
         logger.error(f"Error processing voice input: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to process voice input")
 
+async def _store_default_profile(profile: Dict[str, Any]):
+    """Persist an auto-created profile, logging instead of failing the request"""
+    try:
+        await db.user_profiles.insert_one(profile)
+        logger.info(f"Created default profile for user {profile['id']}")
+    except Exception as e:
+        logger.warning(f"Could not store user profile: {e}")
+
 @api_router.post("/conversations/text", response_model=AIResponse)
-async def process_text_input(text_input: TextInput):
+async def process_text_input(
+    text_input: TextInput,
+    background_tasks: BackgroundTasks,
+    orch: OrchestratorAgent = Depends(get_orchestrator)
+):
     """Process text input through the multi-agent system"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
         # Get user profile or create a default one
-        user_profile = await db.user_profiles.find_one({"id": text_input.user_id})
+        user_profile = await get_profile_cached(text_input.user_id)
         if not user_profile:
             # Create a default user profile for testing/new users
-            default_profile = {
-                "id": text_input.user_id,
-                "user_id": text_input.user_id,  # Add both for compatibility
-                "name": "Test User",
-                "age": 7,
-                "preferences": {
-                    "voice_personality": "friendly_companion",
-                    "learning_goals": ["general_knowledge"],
-                    "favorite_topics": []
-                },
-                "created_at": datetime.now().isoformat()
-            }
+            default_profile = _default_profile(text_input.user_id)
             
-            # Store the profile
-            try:
-                await db.user_profiles.insert_one(default_profile)
-                logger.info(f"Created default profile for user {text_input.user_id}")
-            except Exception as e:
-                logger.warning(f"Could not store user profile: {e}")
+            # Cache it now so follow-up turns see it, and persist after responding
+            _profile_written(text_input.user_id, default_profile)
+            background_tasks.add_task(_store_default_profile, dict(default_profile))
             
             user_profile = default_profile
         
         # Process through orchestrator
-        result = await orchestrator.process_text_input(
+        result = await orch.process_text_input(
             text_input.session_id,
             text_input.message,
             user_profile
@@ -458,12 +552,13 @@ async def process_text_input(text_input: TextInput):
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         
-        return AIResponse(
-            response_text=result["response_text"],
-            response_audio=result.get("response_audio"),
-            content_type=result.get("content_type", "conversation"),
-            metadata=result.get("metadata", {})
-        )
+        # Plain dict: response_model validates and serializes it once on the way out
+        return {
+            "response_text": result["response_text"],
+            "response_audio": result.get("response_audio"),
+            "content_type": result.get("content_type", "conversation"),
+            "metadata": result.get("metadata", {})
+        }
         
     except HTTPException:
         raise
@@ -473,19 +568,16 @@ async def process_text_input(text_input: TextInput):
 
 # Content Management
 @api_router.get("/content/suggestions/{user_id}", response_model=List[ContentSuggestion])
-async def get_content_suggestions(user_id: str):
+async def get_content_suggestions(user_id: str, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get content suggestions for user"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
         # Get user profile
-        user_profile = await db.user_profiles.find_one({"id": user_id})
+        user_profile = await get_profile_cached(user_id)
         if not user_profile:
             raise HTTPException(status_code=404, detail="User profile not found")
         
         # Get suggestions from content agent
-        suggestions = await orchestrator.content_agent.get_content_suggestions(user_profile)
+        suggestions = await orch.content_agent.get_content_suggestions(user_profile)
         
         return [ContentSuggestion(**suggestion) for suggestion in suggestions]
         
@@ -495,102 +587,12 @@ async def get_content_suggestions(user_id: str):
         logger.error(f"Error getting content suggestions: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get content suggestions")
 
-@api_router.post("/conversations/voice")
-async def process_voice_input(request: dict):
-    """Process voice input - simple like ChatGPT/Gemini voice bots"""
-    try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        session_id = request.get("session_id")
-        user_id = request.get("user_id", "test_user")
-        audio_base64 = request.get("audio_base64")
-        
-        if not audio_base64:
-            raise HTTPException(status_code=400, detail="audio_base64 is required")
-        
-        logger.info(f"🎤 Processing voice input: session={session_id}, audio_length={len(audio_base64)}")
-        
-        # Decode audio data
-        try:
-            audio_data = base64.b64decode(audio_base64)
-            logger.info(f"✅ Decoded audio: {len(audio_data)} bytes")
-        except Exception as decode_error:
-            logger.error(f"❌ Base64 decode error: {str(decode_error)}")
-            raise HTTPException(status_code=400, detail="Invalid base64 audio data")
-        
-        # Get or create user profile
-        user_profile = await db.user_profiles.find_one({"id": user_id})
-        if not user_profile:
-            # Create a default user profile
-            user_profile = {
-                "id": user_id,
-                "name": "Test Child",
-                "age": 8,
-                "language": "english",
-                "voice_personality": "friendly_companion",
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-            await db.user_profiles.insert_one(user_profile)
-            logger.info(f"✅ Created default user profile: {user_id}")
-        
-        # Process through voice agent (STT)
-        voice_agent = orchestrator.voice_agent
-        transcript = await voice_agent.speech_to_text(audio_data)
-        
-        if not transcript:
-            return {
-                "status": "no_speech",
-                "response_text": "I didn't catch that. Could you please repeat?",
-                "response_audio": None,
-                "transcript": ""
-            }
-        
-        logger.info(f"🎤 STT result: '{transcript}'")
-        
-        # Process through conversation agent (LLM)
-        conversation_agent = orchestrator.conversation_agent
-        response = await conversation_agent.generate_response(
-            user_input=transcript,
-            user_profile=user_profile,
-            conversation_context=[]  # Simple context for now
-        )
-        
-        # Generate TTS audio
-        response_audio = await voice_agent.text_to_speech(
-            response['text'],
-            user_profile.get('voice_personality', 'friendly_companion')
-        )
-        
-        result = {
-            "status": "success",
-            "response_text": response['text'],
-            "response_audio": response_audio,
-            "transcript": transcript,
-            "content_type": response.get('content_type', 'conversation'),
-            "processing_time": response.get('processing_time', 0.0)
-        }
-        
-        logger.info(f"✅ Voice processing complete: '{response['text'][:100]}...'")
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"❌ Voice processing error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Voice processing failed: {str(e)}")
-
 # Voice Personalities
 @api_router.get("/voice/personalities")
-async def get_voice_personalities():
+async def get_voice_personalities(orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get available voice personalities"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        personalities = orchestrator.voice_agent.get_available_voices()
-        return personalities
+        return Response(content=app.state.personalities_body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error getting voice personalities: {str(e)}")
@@ -598,13 +600,12 @@ async def get_voice_personalities():
 
 # Memory Management Endpoints
 @api_router.post("/memory/snapshot/{user_id}")
-async def generate_memory_snapshot(user_id: str):
+async def generate_memory_snapshot(user_id: str, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Generate daily memory snapshot for a user"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        snapshot = await orchestrator.generate_daily_memory_snapshot(user_id)
+        snapshot = await orch.generate_daily_memory_snapshot(user_id)
+        # The memory agent folds the day's favourite topics into the profile's interests
+        _profile_written(user_id)
         return snapshot
         
     except Exception as e:
@@ -612,32 +613,36 @@ async def generate_memory_snapshot(user_id: str):
         raise HTTPException(status_code=500, detail="Failed to generate memory snapshot")
 
 @api_router.get("/memory/context/{user_id}")
-async def get_memory_context(user_id: str, days: int = 7):
+async def get_memory_context(user_id: str, days: int = 7, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get memory context for a user"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        memory_context = await orchestrator.memory_agent.get_user_memory_context(user_id, days)
+        memory_context = await orch.memory_agent.get_user_memory_context(user_id, days)
         return memory_context
         
     except Exception as e:
         logger.error(f"Error getting memory context: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get memory context")
 
+# Snapshot projections: full documents, or just the fields a dashboard list needs
+_SNAPSHOT_PROJECTION = {"_id": 0}
+_SNAPSHOT_SUMMARY_PROJECTION = {
+    "_id": 0, "user_id": 1, "date": 1, "created_at": 1,
+    "summary": 1, "total_interactions": 1
+}
+
 @api_router.get("/memory/snapshots/{user_id}")
-async def get_memory_snapshots(user_id: str, days: int = 30):
+async def get_memory_snapshots(user_id: str, days: int = 30, summary_only: bool = False):
     """Get memory snapshots for a user"""
     try:
-        from datetime import timedelta
-        
         # Get memory snapshots from database
-        start_date = datetime.utcnow() - timedelta(days=days)
+        start_date = datetime.now(timezone.utc) - timedelta(days=days)
+        projection = _SNAPSHOT_SUMMARY_PROJECTION if summary_only else _SNAPSHOT_PROJECTION
         
+        # Limit server-side so the cursor's first batch carries only what we return
         snapshots = await db.memory_snapshots.find({
             "user_id": user_id,
             "created_at": {"$gte": start_date}
-        }).sort("created_at", -1).to_list(length=days)
+        }, projection).sort("created_at", -1).limit(days).to_list(length=days)
         
         return {"user_id": user_id, "snapshots": snapshots, "count": len(snapshots)}
         
@@ -647,13 +652,10 @@ async def get_memory_snapshots(user_id: str, days: int = 30):
 
 # Telemetry and Analytics Endpoints
 @api_router.get("/analytics/dashboard/{user_id}")
-async def get_analytics_dashboard(user_id: str, days: int = 7):
+async def get_analytics_dashboard(user_id: str, days: int = 7, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get analytics dashboard for a user"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        dashboard = await orchestrator.get_user_analytics_dashboard(user_id, days)
+        dashboard = await orch.get_user_analytics_dashboard(user_id, days)
         return dashboard
         
     except Exception as e:
@@ -661,13 +663,10 @@ async def get_analytics_dashboard(user_id: str, days: int = 7):
         raise HTTPException(status_code=500, detail="Failed to get analytics dashboard")
 
 @api_router.get("/analytics/global")
-async def get_global_analytics(days: int = 7):
+async def get_global_analytics(days: int = 7, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get global analytics dashboard"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        dashboard = await orchestrator.telemetry_agent.get_analytics_dashboard(None, days)
+        dashboard = await orch.telemetry_agent.get_analytics_dashboard(None, days)
         return dashboard
         
     except Exception as e:
@@ -675,13 +674,10 @@ async def get_global_analytics(days: int = 7):
         raise HTTPException(status_code=500, detail="Failed to get global analytics")
 
 @api_router.get("/flags/{user_id}")
-async def get_user_flags(user_id: str):
+async def get_user_flags(user_id: str, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get feature flags for a user"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        flags = await orchestrator.get_user_flags(user_id)
+        flags = await orch.get_user_flags(user_id)
         return {"user_id": user_id, "flags": flags}
         
     except Exception as e:
@@ -689,13 +685,11 @@ async def get_user_flags(user_id: str):
         raise HTTPException(status_code=500, detail="Failed to get user flags")
 
 @api_router.put("/flags/{user_id}")
-async def update_user_flags(user_id: str, flags: Dict[str, Any]):
+async def update_user_flags(user_id: str, flags: Dict[str, Any], orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Update feature flags for a user"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        await orchestrator.update_user_flags(user_id, flags)
+        await orch.update_user_flags(user_id, flags)
+        _profile_written(user_id)
         return {"user_id": user_id, "flags": flags, "status": "updated"}
         
     except Exception as e:
@@ -703,13 +697,10 @@ async def update_user_flags(user_id: str, flags: Dict[str, Any]):
         raise HTTPException(status_code=500, detail="Failed to update user flags")
 
 @api_router.post("/session/end/{session_id}")
-async def end_session(session_id: str):
+async def end_session(session_id: str, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """End a session and get telemetry summary"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        summary = await orchestrator.end_session(session_id)
+        summary = await orch.end_session(session_id)
         return summary
         
     except Exception as e:
@@ -717,13 +708,10 @@ async def end_session(session_id: str):
         raise HTTPException(status_code=500, detail="Failed to end session")
 
 @api_router.get("/agents/status")
-async def get_agents_status():
+async def get_agents_status(orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get status of all agents including memory and telemetry statistics"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        status = await orchestrator.get_agent_status()
+        status = await orch.get_agent_status()
         return status
         
     except Exception as e:
@@ -731,13 +719,10 @@ async def get_agents_status():
         raise HTTPException(status_code=500, detail="Failed to get agents status")
 
 @api_router.post("/maintenance/cleanup")
-async def cleanup_old_data(memory_days: int = 30, telemetry_days: int = 90):
+async def cleanup_old_data(memory_days: int = 30, telemetry_days: int = 90, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Clean up old memory snapshots and telemetry data"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        result = await orchestrator.cleanup_old_data(memory_days, telemetry_days)
+        result = await orch.cleanup_old_data(memory_days, telemetry_days)
         return result
         
     except Exception as e:
@@ -745,29 +730,33 @@ async def cleanup_old_data(memory_days: int = 30, telemetry_days: int = 90):
         raise HTTPException(status_code=500, detail="Failed to cleanup old data")
 
 # Health Check
-@api_router.get("/health")
-async def health_check():
-    """Health check endpoint"""
-    return {
+def _health_body(orchestrator_ready: bool) -> bytes:
+    """Render the health payload; only orchestrator readiness varies at runtime"""
+    return orjson.dumps({
         "status": "healthy",
         "agents": {
-            "orchestrator": orchestrator is not None,
-            "gemini_configured": GEMINI_API_KEY and GEMINI_API_KEY != "your_gemini_key_here",
-            "deepgram_configured": DEEPGRAM_API_KEY and DEEPGRAM_API_KEY != "your_deepgram_key_here"
+            "orchestrator": orchestrator_ready,
+            "gemini_configured": bool(GEMINI_API_KEY and GEMINI_API_KEY != "your_gemini_key_here"),
+            "deepgram_configured": bool(DEEPGRAM_API_KEY and DEEPGRAM_API_KEY != "your_deepgram_key_here")
         },
         "database": "connected"
-    }
+    })
+
+# Both possible health responses, rendered once for load-balancer probes
+_HEALTH_BODIES = {ready: _health_body(ready) for ready in (True, False)}
+
+@api_router.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return Response(content=_HEALTH_BODIES[orchestrator is not None], media_type="application/json")
 
 # Content API Endpoints
 @api_router.get("/content/stories")
-async def get_stories():
+async def get_stories(orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get all available stories"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
         # Get stories from the enhanced content agent's local library
-        enhanced_content_agent = orchestrator.enhanced_content_agent
+        enhanced_content_agent = orch.enhanced_content_agent
         local_content = enhanced_content_agent.local_content
         
         stories = []
@@ -792,13 +781,10 @@ async def get_stories():
         raise HTTPException(status_code=500, detail="Failed to fetch stories")
 
 @api_router.get("/content/{content_type}")
-async def get_content_by_type(content_type: str):
+async def get_content_by_type(content_type: str, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Get content by type (jokes, riddles, facts, songs, rhymes, stories, games)"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
-        enhanced_content_agent = orchestrator.enhanced_content_agent
+        enhanced_content_agent = orch.enhanced_content_agent
         local_content = enhanced_content_agent.local_content
         
         if content_type not in local_content:
@@ -819,12 +805,9 @@ async def get_content_by_type(content_type: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch {content_type}")
 
 @api_router.post("/content/generate")
-async def generate_content(request: dict):
+async def generate_content(request: dict, orch: OrchestratorAgent = Depends(get_orchestrator)):
     """Generate content using enhanced content agent"""
     try:
-        if not orchestrator:
-            raise HTTPException(status_code=500, detail="Multi-agent system not initialized")
-        
         content_type = request.get("content_type")
         user_input = request.get("user_input", "")
         user_id = request.get("user_id")
@@ -833,11 +816,11 @@ async def generate_content(request: dict):
             raise HTTPException(status_code=400, detail="content_type and user_id are required")
         
         # Get user profile
-        user_profile = await db.user_profiles.find_one({"id": user_id})
+        user_profile = await get_profile_cached(user_id)
         if not user_profile:
             raise HTTPException(status_code=404, detail="User profile not found")
         
-        enhanced_content_agent = orchestrator.enhanced_content_agent
+        enhanced_content_agent = orch.enhanced_content_agent
         result = await enhanced_content_agent.get_content_with_3tier_sourcing(
             content_type, user_profile, user_input
         )
@@ -851,108 +834,158 @@ async def generate_content(request: dict):
         raise HTTPException(status_code=500, detail="Failed to generate content")
 
 # WebSocket for real-time communication
+def _ws_json(payload: Any) -> str:
+    """Serialize a WebSocket payload to a JSON text frame"""
+    return orjson.dumps(payload).decode()
+
+async def _handle_ws_text(orch: OrchestratorAgent, user_profile: Dict[str, Any], message_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Process a text WebSocket message"""
+    return await orch.process_text_input(
+        message_data["session_id"],
+        message_data["message"],
+        user_profile
+    )
+
+async def _handle_ws_voice(orch: OrchestratorAgent, user_profile: Dict[str, Any], message_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Process a voice WebSocket message"""
+    audio_data = b64decode(message_data["audio_base64"])
+    return await orch.process_voice_input(
+        message_data["session_id"],
+        audio_data,
+        user_profile
+    )
+
+# WebSocket message type -> handler
+_WS_HANDLERS = {
+    "text": _handle_ws_text,
+    "voice": _handle_ws_voice
+}
+
+# Binary voice frames: big-endian u16 session_id length, session_id (utf-8), raw audio
+WS_BINARY_SUBPROTOCOL = "buddy-bin-v1"
+_WS_FRAME_HEADER = struct.Struct(">H")
+
+async def _handle_ws_audio_frame(orch: OrchestratorAgent, user_profile: Dict[str, Any], frame: bytes) -> Dict[str, Any]:
+    """Process a binary voice frame without any JSON or base64 decoding"""
+    if len(frame) < _WS_FRAME_HEADER.size:
+        return {"error": "Malformed voice frame"}
+    (id_len,) = _WS_FRAME_HEADER.unpack_from(frame)
+    audio_start = _WS_FRAME_HEADER.size + id_len
+    # Need a non-empty session id followed by at least one byte of audio
+    if id_len == 0 or len(frame) <= audio_start:
+        return {"error": "Malformed voice frame"}
+    try:
+        session_id = frame[_WS_FRAME_HEADER.size:audio_start].decode("utf-8")
+    except UnicodeDecodeError:
+        return {"error": "Malformed voice frame"}
+    return await orch.process_voice_input(session_id, frame[audio_start:], user_profile)
+
+# Messages buffered per connection while the previous one is still being processed
+WS_QUEUE_SIZE = 4
+
+async def _ws_consumer(websocket: WebSocket, orch: OrchestratorAgent, user_profile: Dict[str, Any], queue: asyncio.Queue):
+    """Process queued WebSocket messages in arrival order and send each reply; returns once a send fails"""
+    while True:
+        handler, payload = await queue.get()
+        try:
+            result = await handler(orch, user_profile, payload)
+        except Exception as e:
+            logger.error(f"WebSocket message error: {str(e)}")
+            result = {"error": "Processing error occurred"}
+        try:
+            await websocket.send_text(_ws_json(result))
+        except Exception as e:
+            logger.info(f"WebSocket send failed, stopping consumer: {str(e)}")
+            return
+
+async def _ws_unless_stopped(aw, consumer: asyncio.Task):
+    """Await aw, abandoning it with WebSocketDisconnect if the consumer stops first"""
+    task = asyncio.ensure_future(aw)
+    await asyncio.wait({task, consumer}, return_when=asyncio.FIRST_COMPLETED)
+    if not task.done():
+        task.cancel()
+        raise WebSocketDisconnect(1006)
+    return task.result()
+
 @api_router.websocket("/ws/{user_id}")
 async def websocket_endpoint(websocket: WebSocket, user_id: str):
     """WebSocket endpoint for real-time communication"""
-    await websocket.accept()
+    # Clients opting into binary voice frames negotiate the subprotocol on connect
+    subprotocol = WS_BINARY_SUBPROTOCOL if WS_BINARY_SUBPROTOCOL in websocket.scope.get("subprotocols", []) else None
+    await websocket.accept(subprotocol=subprotocol)
     
     try:
+        orch = orchestrator
+        if orch is None:
+            await websocket.send_text(_ws_json({"error": "Multi-agent system not initialized"}))
+            await websocket.close()
+            return
+        
         # Get user profile
-        user_profile = await db.user_profiles.find_one({"id": user_id})
+        user_profile = await get_profile_cached(user_id)
         if not user_profile:
-            await websocket.send_text(json.dumps({"error": "User profile not found"}))
+            await websocket.send_text(_ws_json({"error": "User profile not found"}))
             await websocket.close()
             return
         
-        while True:
-            # Receive message
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
-            
-            if message_data.get("type") == "text":
-                # Process text message
-                result = await orchestrator.process_text_input(
-                    message_data["session_id"],
-                    message_data["message"],
-                    user_profile
-                )
-                
-                await websocket.send_text(json.dumps(result))
+        # Receiving and processing run concurrently; the queue keeps replies in order
+        queue = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+        consumer = asyncio.create_task(_ws_consumer(websocket, orch, user_profile, queue))
+        
+        try:
+            while True:
+                # Receive message; a consumer that stopped on a failed send ends the loop
+                message = await _ws_unless_stopped(websocket.receive(), consumer)
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
                 
-            elif message_data.get("type") == "voice":
-                # Process voice message
-                audio_data = base64.b64decode(message_data["audio_base64"])
-                result = await orchestrator.process_voice_input(
-                    message_data["session_id"],
-                    audio_data,
-                    user_profile
-                )
+                if message.get("bytes") is not None:
+                    await _ws_unless_stopped(queue.put((_handle_ws_audio_frame, message["bytes"])), consumer)
+                    continue
                 
-                await websocket.send_text(json.dumps(result))
+                message_data = orjson.loads(message["text"])
+                handler = _WS_HANDLERS.get(message_data.get("type"))
+                if handler is not None:
+                    await _ws_unless_stopped(queue.put((handler, message_data)), consumer)
+        finally:
+            consumer.cancel()
+            await asyncio.gather(consumer, return_exceptions=True)
                 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for user: {user_id}")
     except Exception as e:
         logger.error(f"WebSocket error: {str(e)}")
-        await websocket.send_text(json.dumps({"error": "Connection error"}))
+        await websocket.send_text(_ws_json({"error": "Connection error"}))
+
+async def ensure_indexes():
+    """Create indexes backing the per-request profile, controls and snapshot lookups"""
+    try:
+        await db.user_profiles.create_index("id", unique=True)
+        await db.parental_controls.create_index("user_id", unique=True)
+        await db.conversation_sessions.create_index("id")
+        await db.memory_snapshots.create_index([("user_id", 1), ("created_at", -1)])
+        logger.info("Database indexes ensured")
+        
+    except Exception as e:
+        logger.error(f"Error creating database indexes: {str(e)}")
+
+# Seed documents are independent and re-created on an empty DB, so a primary ack is enough
+_SEED_WRITE_CONCERN = WriteConcern(w=1)
 
 async def init_default_content():
     """Initialize default content if database is empty"""
     try:
-        # Check if content exists
-        story_count = await db.stories.count_documents({})
+        # Check if content exists (metadata count; we only compare against zero)
+        story_count = await db.stories.estimated_document_count()
         
         if story_count == 0:
             logger.info("Initializing default content...")
             
-            # Add default stories
-            default_stories = [
-                {
-                    "id": "story_001",
-                    "title": "The Happy Little Bear",
-                    "content": "Once there was a little bear who loved to play. He played with his friends every day in the forest. The bear was always happy and kind to everyone. The end!",
-                    "age_group": "toddler",
-                    "language": "english",
-                    "tags": ["animals", "friendship", "happiness"],
-                    "difficulty_level": 1,
-                    "content_type": "story",
-                    "story_type": "fairy_tale",
-                    "reading_time": 2
-                },
-                {
-                    "id": "story_002", 
-                    "title": "The Brave Little Mouse",
-                    "content": "A small mouse lived in a big house. One day, he helped his family by being very brave and clever. Everyone was proud of him and celebrated his courage!",
-                    "age_group": "child",
-                    "language": "english",
-                    "tags": ["courage", "family", "problem-solving"],
-                    "difficulty_level": 2,
-                    "content_type": "story",
-                    "story_type": "moral",
-                    "reading_time": 3
-                }
-            ]
+            # Seed documents live in seed_content.json next to this module
+            seed = orjson.loads((ROOT_DIR / "seed_content.json").read_bytes())
             
-            await db.stories.insert_many(default_stories)
-            
-            # Add default songs
-            default_songs = [
-                {
-                    "id": "song_001",
-                    "title": "Twinkle Twinkle Little Star",
-                    "content": "Twinkle, twinkle, little star, How I wonder what you are! Up above the world so high, Like a diamond in the sky!",
-                    "age_group": "toddler",
-                    "language": "english",
-                    "tags": ["stars", "wonder", "night"],
-                    "difficulty_level": 1,
-                    "content_type": "song",
-                    "song_type": "lullaby",
-                    "lyrics": "Twinkle, twinkle, little star, How I wonder what you are!",
-                    "duration": 60
-                }
-            ]
-            
-            await db.songs.insert_many(default_songs)
+            await db.stories.with_options(write_concern=_SEED_WRITE_CONCERN).insert_many(seed["stories"], ordered=False)
+            await db.songs.with_options(write_concern=_SEED_WRITE_CONCERN).insert_many(seed["songs"], ordered=False)
             
             logger.info("Default content initialized successfully")
             
@@ -962,20 +995,25 @@ async def init_default_content():
 # Include router in main app
 app.include_router(api_router)
 
-# Add CORS middleware
+# Add CORS middleware; set CORS_ORIGINS to a comma-separated allow-list in production
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS"),
+    allow_headers=("authorization", "content-type"),
 )
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
     """Cleanup on shutdown"""
     client.close()
+    
+    # Release the pooled Deepgram connections shared by all voice requests
+    if orchestrator is not None:
+        orchestrator.voice_agent.http.close()
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    # uvicorn's default loop/parser already pick uvloop and httptools when installed
+    uvicorn.run(app, host="0.0.0.0", port=8001, ws="websockets")
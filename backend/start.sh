@@ -0,0 +1,22 @@
+#!/usr/bin/env bash
+# Production entrypoint: gunicorn managing uvicorn workers
+#
+# Conversation state (session history, mic lock) lives in each worker's
+# orchestrator, so only raise WEB_CONCURRENCY above 1 behind a load balancer
+# with sticky sessions keyed on the client. server.py turns its per-process
+# profile cache off when WEB_CONCURRENCY > 1, so set it rather than passing -w.
+set -euo pipefail
+
+cd "$(dirname "$0")"
+
+WORKERS="${WEB_CONCURRENCY:-1}"
+PORT="${PORT:-8001}"
+# BACKEND_SOCK binds a UNIX socket instead, for clients colocated on the host
+BIND="${BACKEND_SOCK:+unix:${BACKEND_SOCK}}"
+BIND="${BIND:-0.0.0.0:${PORT}}"
+
+exec gunicorn server:app \
+    -k uvicorn.workers.UvicornWorker \
+    -w "${WORKERS}" \
+    --bind "${BIND}" \
+    --timeout "${GUNICORN_TIMEOUT:-120}"
@@ -6,399 +6,861 @@ Tests all backend endpoints and multi-agent system functionality
 
 import asyncio
 import aiohttp
+import functools
+from operator import itemgetter
 import json
 import base64
 import uuid
 import os
+import random
+import re
+from yarl import URL
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Callable, NamedTuple, Optional, Tuple
 import logging
+import logging.handlers
+import queue
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging; records are handed to a listener thread so the event loop
+# never blocks on stderr writes
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(
+    level=os.environ.get("BACKEND_TEST_LOG_LEVEL", "INFO"),
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+# QueueHandler formats the record up front, so the listener writes the message as-is
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(), respect_handler_level=True)
 logger = logging.getLogger(__name__)
 
 # Get backend URL from environment
-BACKEND_URL = "http://10.64.147.115:8001/api"
+BACKEND_URL = os.environ.get("BACKEND_URL", "http://10.64.147.115:8001/api")
+
+# When the backend runs alongside the tester, BACKEND_SOCK points at its UNIX
+# socket; requests then skip the TCP stack and the URL's host is ignored
+BACKEND_SOCK = os.environ.get("BACKEND_SOCK")
+
+# aiohttp's 5-minute total is kept for the slow LLM+TTS endpoints; only connects fail fast
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=5 * 60, connect=5)
+
+# Connection pool sized to the suite's concurrency rather than left unbounded
+POOL_LIMIT = 32
+POOL_LIMIT_PER_HOST = 16
+
+# Retry policy for idempotent requests: exponential backoff with jitter
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.2
+RETRY_METHODS = frozenset({"GET", "PUT"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+# Deadline for each test in a concurrent tier; sequential tests rely on HTTP_TIMEOUT.
+# Never shorter than one request's timeout, so slow LLM-backed calls are not cut off early
+TIER_TEST_TIMEOUT = HTTP_TIMEOUT.total
+
+# Concurrent prompts per content-library test; each one is an LLM round trip
+CONTENT_LIBRARY_CONCURRENCY = 4
+
+# Prompt rate for the LLM-backed content tests, in place of fixed sleeps
+CONTENT_PROMPTS_PER_SECOND = 5
+
+# Largest JSON body the tester will buffer; TTS audio inflates some responses
+MAX_RESPONSE_BYTES = 8 << 20
+
+# Content replies carry one clip of TTS audio; anything past this is a runaway generation
+CONTENT_RESPONSE_MAX_BYTES = 2 << 20
+
+
+# orjson when available; the stdlib fallback keeps the suite runnable on PyPy,
+# where orjson ships no wheels and the JIT makes the pure-Python codec cheap
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> str:
+        """orjson encoder for aiohttp's json= bodies"""
+        return orjson.dumps(obj).decode()
+    
+    _json_bytes = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+    
+    def _json_bytes(obj) -> bytes:
+        """stdlib stand-in for orjson.dumps"""
+        return json.dumps(obj).encode()
+
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+def _keyword_re(*keywords):
+    """One case-insensitive alternation matching any keyword as a substring"""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Content-library quality signals, compiled once so each response is scanned
+# by a single regex per signal instead of lowering it and testing every word
+_STORY_MORAL_RE = _keyword_re("moral", "lesson", "learned", "important", "remember", "wise")
+_STORY_ENDING_RE = _keyword_re("the end", "happily ever after", "lived happily", "and so")
+_SONG_ACTION_RE = _keyword_re("clap", "stomp", "jump", "dance", "move", "hands", "feet")
+_SONG_REACTION_RE = _keyword_re("let's sing", "come on", "together", "fun", "great job")
+_SONG_REPETITION_RE = _keyword_re("la la", "tra la", "again", "repeat", "chorus")
+_RHYME_LESSON_RE = _keyword_re("careful", "lesson", "important", "remember", "wise", "learn")
+_GAME_INSTRUCTION_RE = _keyword_re("let's", "here's how", "rules", "instructions", "first", "step")
+_GAME_REACTION_RE = _keyword_re("great", "awesome", "fantastic", "wonderful", "excellent", "amazing")
+_GAME_INTERACTIVE_RE = _keyword_re("your turn", "what do you", "can you", "try to", "guess")
+_GAME_EDUCATIONAL_RE = _keyword_re("learn", "practice", "skill", "brain", "smart", "clever")
+_JOKE_INAPPROPRIATE_RE = _keyword_re("scary", "violent", "adult", "inappropriate")
+_JOKE_RIDDLE_RE = _keyword_re("what am i", "guess", "riddle", "answer", "think")
+_JOKE_CELEBRATION_RE = _keyword_re("great job", "correct", "well done", "amazing", "fantastic")
+_JOKE_REACTION_RE = _keyword_re("wow", "amazing", "incredible", "fantastic", "cool")
+
+# Conversation quality, filtering and engagement signals
+_EMOTION_RE = _keyword_re("😂", "🤯", "✨", "🎵", "🎭", "🌟", "💫", "🎪")
+_REENGAGEMENT_RE = _keyword_re("want another", "should we", "would you like", "let's try", "how about")
+_ENGAGING_RE = _keyword_re("amazing", "wonderful", "fantastic", "incredible", "awesome", "great")
+_INAPPROPRIATE_RE = _keyword_re("scary", "violent", "inappropriate", "adult", "frightening")
+_REDIRECTION_RE = _keyword_re("instead", "how about", "let me tell you", "better idea")
+_PERSONALIZATION_RE = _keyword_re("emma", "you", "your", "for you", "just for")
+_EMPATHY_RE = _keyword_re("understand", "feel", "sorry", "here for you", "help")
+_ACTIVITY_OFFER_RE = _keyword_re("let's", "how about", "want to", "shall we", "would you like")
+
+
+def _has_rhyming_pattern(text):
+    """Check if text contains rhyming patterns"""
+    # Simple rhyme detection - look for common rhyming endings
+    lines = text.split('\n')
+    if len(lines) < 2:
+        return False
+    
+    # Check for common nursery rhyme patterns
+    rhyme_patterns = [
+        ("wall", "fall"), ("hill", "jill"), ("dock", "clock"),
+        ("lamb", "snow"), ("star", "are"), ("high", "sky")
+    ]
+    
+    text_lower = text.lower()
+    return any(pattern[0] in text_lower and pattern[1] in text_lower for pattern in rhyme_patterns)
+
+
+def _has_at_least(text, sub, n):
+    """True once sub has been found n times; stops scanning at the nth match"""
+    index = -1
+    for _ in range(n):
+        index = text.find(sub, index + 1)
+        if index < 0:
+            return False
+    return True
+
+
+def _story_signals(text):
+    word_count = len(text.split())
+    return {
+        "word_count": word_count,
+        "full_length": 400 <= word_count <= 800,
+        "has_moral": bool(_STORY_MORAL_RE.search(text)),
+        "has_engaging_ending": bool(_STORY_ENDING_RE.search(text))
+    }
+
+
+def _song_signals(text):
+    return {
+        "has_verses": _has_at_least(text, '\n', 3),  # Multiple lines suggest verses
+        "has_actions": bool(_SONG_ACTION_RE.search(text)),
+        "has_engaging_reaction": bool(_SONG_REACTION_RE.search(text)),
+        "has_repetition": bool(_SONG_REPETITION_RE.search(text))
+    }
+
+
+def _rhyme_signals(text):
+    return {
+        "has_rhyming": _has_rhyming_pattern(text),
+        "has_full_version": len(text.split()) >= 20,  # Full nursery rhymes are typically longer
+        "has_moral_lesson": bool(_RHYME_LESSON_RE.search(text))
+    }
+
+
+def _game_signals(text):
+    return {
+        "has_clear_instructions": bool(_GAME_INSTRUCTION_RE.search(text)),
+        "has_enthusiastic_reaction": bool(_GAME_REACTION_RE.search(text)),
+        "has_interactive_elements": bool(_GAME_INTERACTIVE_RE.search(text)),
+        "is_educational": bool(_GAME_EDUCATIONAL_RE.search(text))
+    }
+
+
+def _joke_riddle_signals(text):
+    return {
+        "is_age_appropriate": _JOKE_INAPPROPRIATE_RE.search(text) is None,
+        "has_interactive_riddle": bool(_JOKE_RIDDLE_RE.search(text)),
+        "has_celebration": bool(_JOKE_CELEBRATION_RE.search(text)),
+        "has_enthusiastic_reaction": bool(_JOKE_REACTION_RE.search(text))
+    }
+
+
+class ContentLibraryTest(NamedTuple):
+    """Prompts and scoring for one content-library category"""
+    prompts: List[str]
+    total_key: str  # result key for the number of prompts sent
+    detected_key: str  # per-response key for the content-type check
+    detect: Callable[[str], bool]  # content_type -> detected
+    analyze: Callable[[str], Dict[str, Any]]  # response_text -> quality signals
+    metrics: List[Tuple[str, str, str]]  # (count key, rate key, per-response flag)
+
+
+CONTENT_LIBRARY_TESTS = {
+    "story": ContentLibraryTest(
+        prompts=[
+            "Tell me a story about three little pigs",
+            "Tell me the story of Goldilocks",
+            "Tell me about the tortoise and the hare",
+            "Tell me about the ugly duckling",
+            "Tell me a story about Little Red Riding Hood"
+        ],
+        total_key="total_stories_tested",
+        detected_key="story_detected",
+        detect=lambda ct: ct == "story" or "story" in ct,
+        analyze=_story_signals,
+        metrics=[
+            ("stories_detected", "story_detection_rate", "story_detected"),
+            ("full_length_stories", "full_length_rate", "full_length"),
+            ("stories_with_morals", "moral_inclusion_rate", "has_moral")
+        ]
+    ),
+    "song": ContentLibraryTest(
+        prompts=[
+            "Sing Mary had a little lamb",
+            "Sing the wheels on the bus",
+            "Sing the ABC song",
+            "Sing Old MacDonald",
+            "Sing itsy bitsy spider",
+            "Sing Twinkle Twinkle Little Star"
+        ],
+        total_key="total_songs_tested",
+        detected_key="song_detected",
+        detect=lambda ct: ct == "song" or "song" in ct,
+        analyze=_song_signals,
+        metrics=[
+            ("songs_detected", "song_detection_rate", "song_detected"),
+            ("songs_with_verses", "verse_inclusion_rate", "has_verses"),
+            ("songs_with_actions", "action_inclusion_rate", "has_actions")
+        ]
+    ),
+    "rhyme": ContentLibraryTest(
+        prompts=[
+            "Tell me Humpty Dumpty",
+            "Say Jack and Jill",
+            "Recite Hickory Dickory Dock",
+            "Tell me Mary Had a Little Lamb"
+        ],
+        total_key="total_rhymes_tested",
+        detected_key="rhyme_detected",
+        detect=lambda ct: ct == "rhyme" or "rhyme" in ct or "nursery" in ct,
+        analyze=_rhyme_signals,
+        metrics=[
+            ("rhymes_detected", "rhyme_detection_rate", "rhyme_detected"),
+            ("rhymes_with_patterns", "rhyming_pattern_rate", "has_rhyming"),
+            ("full_version_rhymes", "full_version_rate", "has_full_version")
+        ]
+    ),
+    "game": ContentLibraryTest(
+        prompts=[
+            "Let's play quick math",
+            "Let's play animal sounds",
+            "Let's play color hunt",
+            "Let's build a story",
+            "Let's play a guessing game"
+        ],
+        total_key="total_games_tested",
+        detected_key="game_detected",
+        detect=lambda ct: ct == "game" or "game" in ct or "play" in ct,
+        analyze=_game_signals,
+        metrics=[
+            ("games_detected", "game_detection_rate", "game_detected"),
+            ("games_with_instructions", "instruction_rate", "has_clear_instructions"),
+            ("interactive_games", "interactivity_rate", "has_interactive_elements")
+        ]
+    ),
+    "joke_riddle": ContentLibraryTest(
+        prompts=[
+            "Tell me a joke",
+            "Make me laugh",
+            "Tell me a riddle",
+            "Give me a brain teaser",
+            "Tell me something funny",
+            "Share an amazing fact"
+        ],
+        total_key="total_requests_tested",
+        detected_key="content_detected",
+        detect=lambda ct: any(kind in ct for kind in ["joke", "riddle", "fact", "fun"]),
+        analyze=_joke_riddle_signals,
+        metrics=[
+            ("content_detected", "content_detection_rate", "content_detected"),
+            ("age_appropriate_content", "age_appropriate_rate", "is_age_appropriate"),
+            ("interactive_content", "interactivity_rate", "has_interactive_riddle")
+        ]
+    )
+}
+
+
+class ResponseTooLarge(ValueError):
+    """Response body exceeded the tester's read cap"""
+
+
+async def _read_capped(response, cap=MAX_RESPONSE_BYTES):
+    """Read a response body in chunks, refusing bodies larger than cap"""
+    if response.content_length is not None and response.content_length > cap:
+        raise ResponseTooLarge(f"Response body of {response.content_length} bytes exceeds {cap} byte cap")
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(65536):
+        size += len(chunk)
+        if size > cap:
+            raise ResponseTooLarge(f"Response body exceeds {cap} byte cap")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@dataclass(slots=True)
+class ErrorTestResult:
+    """Outcome of one invalid-request check in test_error_handling"""
+    test: str
+    status: Optional[int] = None
+    handled_correctly: bool = False
+    error: Optional[str] = None
+
+
+# Invalid payloads for test_error_handling; read-only views over shared constants
+_INVALID_AGE_PROFILE = MappingProxyType({
+    "name": "Test",
+    "age": 15,  # Invalid age
+    "location": "Test"
+})
+_INVALID_CONVERSATION = MappingProxyType({
+    "session_id": "invalid_session",
+    "user_id": "invalid_user",
+    "message": ""
+})
+
+
+class RateLimiter:
+    """Spaces acquisitions at least period/rate seconds apart without idling between them"""
+    
+    def __init__(self, rate, period=1.0):
+        self._interval = period / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_slot > now:
+                await asyncio.sleep(self._next_slot - now)
+                now = self._next_slot
+            self._next_slot = now + self._interval
+
+
+async def _gather_bounded(coros, limit):
+    """gather() with at most limit awaitables in flight; results keep input order"""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+
+async def _json(response, cap=MAX_RESPONSE_BYTES):
+    """Decode a JSON response body of at most cap bytes"""
+    return _json_loads(await _read_capped(response, cap))
+
+
+def http_test(extract):
+    """Build a single-request test from a method returning (method, path, request kwargs).
+
+    The method may instead return a result dict to skip the request, e.g. when a
+    prerequisite ID is missing. 200 responses are summarised by extract(self, data).
+    """
+    def decorator(build):
+        @functools.wraps(build)
+        async def wrapper(self):
+            request = build(self)
+            if isinstance(request, dict):
+                return request
+            method, path, kwargs = request
+            return await self._request_test(method, path, kwargs, extract)
+        return wrapper
+    return decorator
+
+
+def _analytics_summary(data):
+    return {
+        "has_date_range": bool(data.get("date_range")),
+        "total_users": data.get("total_users", 0),
+        "total_sessions": data.get("total_sessions", 0),
+        "total_interactions": data.get("total_interactions", 0),
+        "has_feature_usage": bool(data.get("feature_usage")),
+        "has_engagement_trends": bool(data.get("engagement_trends"))
+    }
+
+
+_HEALTH_FIELDS = itemgetter("status", "agents", "database")
+_AGENT_FIELDS = itemgetter("orchestrator", "gemini_configured", "deepgram_configured")
+_PROFILE_FIELDS = itemgetter("id", "name", "age", "interests")
+_UNTOUCHED_PROFILE_FIELDS = itemgetter("id", "name", "age", "location", "voice_personality")
+_CONTROLS_KEYS = ("user_id", "time_limits", "monitoring_enabled", "allowed_content_types")
+_CONTROLS_FIELDS = itemgetter(*_CONTROLS_KEYS)
+
+
+def _health_summary(data):
+    status, agents, database = _HEALTH_FIELDS(data)
+    orchestrator, gemini_configured, deepgram_configured = _AGENT_FIELDS(agents)
+    return {
+        "status": status,
+        "agents_initialized": orchestrator,
+        "gemini_configured": gemini_configured,
+        "deepgram_configured": deepgram_configured,
+        "database": database
+    }
+
+
+def _flags_summary(data):
+    flags = data.get("flags", {})
+    return {
+        "user_id": data.get("user_id"),
+        "flags_count": len(flags),
+        "has_emoji_usage": "emoji_usage" in flags,
+        "has_memory_snapshots": "memory_snapshots" in flags,
+        "has_ambient_listening": "ambient_listening" in flags,
+        "flags_structure": isinstance(flags, dict)
+    }
+
+
+def _summarise(extract, data):
+    """Run a GET_TESTS extractor, reporting missing fields as a failed check"""
+    try:
+        return extract(data)
+    except KeyError as e:
+        return {"success": False, "error": f"Missing required keys in response: {e}"}
+
+
+# GET tests whose body later tests reuse: name -> BackendTester attribute it is kept on
+STASHED_GET_TESTS = {
+    "User Profile Retrieval": "_profile"
+}
+
+# GET-only smoke tests: name -> (path template, extractor). Extractors index
+# required fields directly; a KeyError marks the response as incomplete.
+# Paths containing {user_id} are skipped until a test user exists.
+GET_TESTS = {
+    "Health Check": ("/health", _health_summary),
+    "Voice Personalities": ("/voice/personalities", lambda d: {
+        "personalities_count": len(d),
+        "available_personalities": list(d.keys()) if isinstance(d, dict) else [],
+        "has_descriptions": all("description" in v for v in d.values()) if isinstance(d, dict) else False
+    }),
+    "Global Analytics": ("/analytics/global?days=7", lambda d: {
+        **_analytics_summary(d),
+        "analytics_structure": "global"
+    }),
+    "User Profile Retrieval": ("/users/profile/{user_id}", lambda d: dict(
+        zip(("user_id", "name", "age", "interests"), _PROFILE_FIELDS(d))
+    )),
+    "Parental Controls Retrieval": ("/users/{user_id}/parental-controls", lambda d: dict(
+        zip(_CONTROLS_KEYS, _CONTROLS_FIELDS(d))
+    )),
+    "Content Suggestions": ("/content/suggestions/{user_id}", lambda d: {
+        "suggestions_count": len(d),
+        "has_suggestions": len(d) > 0,
+        "suggestion_types": [item.get("content_type") for item in d] if d else []
+    }),
+    "Memory Context Retrieval": ("/memory/context/{user_id}?days=7", lambda d: {
+        "user_id": d.get("user_id"),
+        "has_memory_context": bool(d.get("memory_context") or d.get("recent_preferences")),
+        "context_type": type(d.get("memory_context", "")).__name__,
+        "has_preferences": bool(d.get("recent_preferences")),
+        "has_topics": bool(d.get("favorite_topics"))
+    }),
+    "Memory Snapshots History": ("/memory/snapshots/{user_id}?days=30&summary_only=true", lambda d: {
+        "user_id": d.get("user_id"),
+        "snapshots_count": d.get("count", 0),
+        "has_snapshots": bool(d.get("snapshots")),
+        "snapshots_structure": bool(isinstance(d.get("snapshots"), list))
+    }),
+    "Analytics Dashboard": ("/analytics/dashboard/{user_id}?days=7", lambda d: {
+        **_analytics_summary(d),
+        "has_daily_breakdown": bool(d.get("daily_breakdown"))
+    }),
+    "User Feature Flags": ("/flags/{user_id}", _flags_summary),
+    "Agent Status with Memory & Telemetry": ("/agents/status", lambda d: {
+        "orchestrator_active": d.get("orchestrator") == "active",
+        "memory_agent_active": d.get("memory_agent") == "active",
+        "telemetry_agent_active": d.get("telemetry_agent") == "active",
+        "has_memory_statistics": bool(d.get("memory_statistics")),
+        "has_telemetry_statistics": bool(d.get("telemetry_statistics")),
+        "session_count": d.get("session_count", 0),
+        "active_games": d.get("active_games", 0),
+        "all_agents_count": len([k for k, v in d.items() if v == "active"])
+    })
+}
 
 class BackendTester:
     """Comprehensive backend API tester"""
     
+    # Fixed mock audio payloads, encoded once at import
+    _MOCK_AUDIO_B64 = base64.b64encode(b"mock_audio_data_for_testing").decode('utf-8')
+    _TEST_AUDIO_B64 = base64.b64encode(b"test_audio_data").decode('utf-8')
+    
     def __init__(self):
         self.session = None
         self.test_results = {}
         self.test_user_id = None
         self.test_session_id = None
+        self._urls = {}
+        self._snapshot_created = False
+        self._profile = None  # Stored profile as last fetched by User Profile Retrieval
+        self.rate = RateLimiter(CONTENT_PROMPTS_PER_SECOND)
+        # Encoded '{"session_id":..,"user_id":..' head of text_input bodies, and the ids it encodes
+        self._text_prefix = b""
+        self._text_prefix_ids = None
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        _log_listener.start()
+        # One pooled session for the whole run with warm keep-alive. The widest fan-out is
+        # a 3-test tier or a 4-prompt content-library batch, so 16 sockets leaves headroom
+        if BACKEND_SOCK:
+            connector = aiohttp.UnixConnector(path=BACKEND_SOCK, limit=POOL_LIMIT, keepalive_timeout=75)
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=POOL_LIMIT, limit_per_host=POOL_LIMIT_PER_HOST, ttl_dns_cache=600, keepalive_timeout=75
+            )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT, json_serialize=_json_dumps)
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+        _log_listener.stop()
     
     async def run_all_tests(self):
         """Run all backend tests"""
         logger.info("Starting comprehensive backend API testing...")
         
-        # Test sequence based on dependencies - PRIORITIZING FIXED VOICE PROCESSING
-        test_sequence = [
+        # Tests grouped into dependency tiers. Tests within a tier run concurrently;
+        # tiers run in order. Stateful conversation/session tests stay one per tier
+        # because they share the voice session and its mic lock/rate limits.
+        test_tiers = [
             # FIXED VOICE PROCESSING TESTS (TOP PRIORITY)
-            ("FIXED VOICE - Fixed Voice Endpoint (process_voice_input method)", self.test_fixed_voice_endpoint),
-            ("SIMPLIFIED VOICE - New Voice Endpoint", self.test_simplified_voice_endpoint),
-            ("SIMPLIFIED VOICE - STT with Various Audio Formats", self.test_stt_audio_formats),
-            ("SIMPLIFIED VOICE - TTS with Different Text Inputs", self.test_tts_text_inputs),
-            ("SIMPLIFIED VOICE - Enhanced Child Speech Recognition", self.test_enhanced_child_speech),
-            ("SIMPLIFIED VOICE - End-to-End Voice Flow", self.test_end_to_end_voice_flow),
-            ("SIMPLIFIED VOICE - Error Handling Invalid Audio", self.test_voice_error_handling),
-            ("SIMPLIFIED VOICE - Performance Testing", self.test_voice_performance),
-            ("SIMPLIFIED VOICE - Form Data Processing", self.test_voice_form_data),
+            [("FIXED VOICE - Fixed Voice Endpoint (process_voice_input method)", self.test_fixed_voice_endpoint)],
+            [("SIMPLIFIED VOICE - New Voice Endpoint", self.test_simplified_voice_endpoint)],
+            [("SIMPLIFIED VOICE - STT with Various Audio Formats", self.test_stt_audio_formats)],
+            [("SIMPLIFIED VOICE - TTS with Different Text Inputs", self.test_tts_text_inputs)],
+            [("SIMPLIFIED VOICE - Enhanced Child Speech Recognition", self.test_enhanced_child_speech)],
+            [("SIMPLIFIED VOICE - End-to-End Voice Flow", self.test_end_to_end_voice_flow)],
+            [("SIMPLIFIED VOICE - Error Handling Invalid Audio", self.test_voice_error_handling)],
+            [("SIMPLIFIED VOICE - Performance Testing", self.test_voice_performance)],
+            [("SIMPLIFIED VOICE - Form Data Processing", self.test_voice_form_data)],
             
             # CRITICAL DEEPGRAM REST API VALIDATION TESTS (TOP PRIORITY)
-            ("CRITICAL - Deepgram REST API Compliance Check", self.test_deepgram_rest_api_compliance),
-            ("CRITICAL - STT Nova-3 Multi-Language Endpoint", self.test_stt_nova3_multilang_endpoint),
-            ("CRITICAL - TTS Aura-2-Amalthea Endpoint", self.test_tts_aura2_amalthea_endpoint),
-            ("CRITICAL - Voice Pipeline REST API Integration", self.test_voice_pipeline_rest_integration),
-            ("CRITICAL - Wake Word Detection with REST API", self.test_wake_word_rest_detection),
-            ("CRITICAL - Audio Base64 Processing Validation", self.test_audio_base64_validation),
-            ("CRITICAL - Voice Personalities REST Configuration", self.test_voice_personalities_rest_config),
+            [("CRITICAL - Deepgram REST API Compliance Check", self.test_deepgram_rest_api_compliance)],
+            [("CRITICAL - STT Nova-3 Multi-Language Endpoint", self.test_stt_nova3_multilang_endpoint)],
+            [("CRITICAL - TTS Aura-2-Amalthea Endpoint", self.test_tts_aura2_amalthea_endpoint)],
+            [("CRITICAL - Voice Pipeline REST API Integration", self.test_voice_pipeline_rest_integration)],
+            [("CRITICAL - Wake Word Detection with REST API", self.test_wake_word_rest_detection)],
+            [("CRITICAL - Audio Base64 Processing Validation", self.test_audio_base64_validation)],
+            [("CRITICAL - Voice Personalities REST Configuration", self.test_voice_personalities_rest_config)],
             
             # STANDARD BACKEND TESTS
-            ("Health Check", self.test_health_check),
-            ("User Profile Creation", self.test_create_user_profile),
-            ("User Profile Retrieval", self.test_get_user_profile),
-            ("User Profile Update", self.test_update_user_profile),
-            ("Parental Controls Retrieval", self.test_get_parental_controls),
-            ("Parental Controls Update", self.test_update_parental_controls),
-            ("Conversation Session Creation", self.test_create_conversation_session),
-            ("Text Conversation", self.test_text_conversation),
-            ("Voice Conversation", self.test_voice_conversation),
-            ("Content Suggestions", self.test_content_suggestions),
-            ("Content by Type", self.test_content_by_type),
-            ("Voice Personalities", self.test_voice_personalities),
-            ("Memory Snapshot Generation", self.test_memory_snapshot_generation),
-            ("Memory Context Retrieval", self.test_memory_context_retrieval),
-            ("Memory Snapshots History", self.test_memory_snapshots_history),
-            ("Enhanced Conversation with Memory", self.test_enhanced_conversation_with_memory),
-            ("Analytics Dashboard", self.test_analytics_dashboard),
-            ("Global Analytics", self.test_global_analytics),
-            ("User Feature Flags", self.test_user_feature_flags),
-            ("Update Feature Flags", self.test_update_feature_flags),
-            ("Session End Telemetry", self.test_session_end_telemetry),
-            ("Agent Status with Memory & Telemetry", self.test_agent_status_enhanced),
-            ("Maintenance Cleanup", self.test_maintenance_cleanup),
-            ("Ambient Listening Integration", self.test_ambient_listening_integration),
+            # Independent probes plus the profile every later test uses
+            [
+                ("Health Check", self._get_test("Health Check")),
+                ("User Profile Creation", self.test_create_user_profile),
+                ("Voice Personalities", self._get_test("Voice Personalities"))
+            ],
+            # Reads and setup that only need the new user
+            [
+                ("User Profile Retrieval", self._get_test("User Profile Retrieval")),
+                ("Parental Controls Retrieval", self._get_test("Parental Controls Retrieval")),
+                ("Conversation Session Creation", self.test_create_conversation_session)
+            ],
+            [
+                ("User Profile Update", self.test_update_user_profile),
+                ("Parental Controls Update", self.test_update_parental_controls)
+            ],
+            [("Text Conversation", self.test_text_conversation)],
+            [("Voice Conversation", self.test_voice_conversation)],
+            # Suggestions and the snapshot summarise the conversations above
+            [
+                ("Content Suggestions", self._get_test("Content Suggestions")),
+                ("Content by Type", self.test_content_by_type),
+                ("Memory Snapshot Generation", self.test_memory_snapshot_generation)
+            ],
+            [
+                ("Memory Context Retrieval", self._get_test("Memory Context Retrieval")),
+                ("Memory Snapshots History", self._get_test("Memory Snapshots History"))
+            ],
+            [("Enhanced Conversation with Memory", self.test_enhanced_conversation_with_memory)],
+            [
+                ("Analytics Dashboard", self._get_test("Analytics Dashboard")),
+                ("Global Analytics", self._get_test("Global Analytics")),
+                ("User Feature Flags", self._get_test("User Feature Flags"))
+            ],
+            [("Update Feature Flags", self.test_update_feature_flags)],
+            [("Session End Telemetry", self.test_session_end_telemetry)],
+            [("Agent Status with Memory & Telemetry", self._get_test("Agent Status with Memory & Telemetry"))],
+            [("Maintenance Cleanup", self.test_maintenance_cleanup)],
+            [("Ambient Listening Integration", self.test_ambient_listening_integration)],
             # NEW SESSION MANAGEMENT TESTS
-            ("Session Management - Mic Lock Functionality", self.test_mic_lock_functionality),
-            ("Session Management - Break Suggestion Logic", self.test_break_suggestion_logic),
-            ("Session Management - Interaction Rate Limiting", self.test_interaction_rate_limiting),
-            ("Session Management - Session Tracking", self.test_session_tracking),
-            ("Enhanced Conversation Flow - Mic Lock Responses", self.test_enhanced_conversation_mic_lock),
-            ("Enhanced Conversation Flow - Rate Limit Responses", self.test_enhanced_conversation_rate_limit),
-            ("Enhanced Conversation Flow - Break Suggestion Responses", self.test_enhanced_conversation_break_suggestion),
-            ("Enhanced Conversation Flow - Interaction Count Increment", self.test_enhanced_conversation_interaction_count),
-            ("Session Management Integration - Start Ambient with Session Tracking", self.test_start_ambient_with_session_tracking),
-            ("Session Management Integration - Session Store Maintenance", self.test_session_store_maintenance),
-            ("Session Management Integration - Telemetry Events", self.test_session_management_telemetry_events),
-            ("Error Handling", self.test_error_handling),
+            [("Session Management - Mic Lock Functionality", self.test_mic_lock_functionality)],
+            [("Session Management - Break Suggestion Logic", self.test_break_suggestion_logic)],
+            [("Session Management - Interaction Rate Limiting", self.test_interaction_rate_limiting)],
+            [("Session Management - Session Tracking", self.test_session_tracking)],
+            [("Enhanced Conversation Flow - Mic Lock Responses", self.test_enhanced_conversation_mic_lock)],
+            [("Enhanced Conversation Flow - Rate Limit Responses", self.test_enhanced_conversation_rate_limit)],
+            [("Enhanced Conversation Flow - Break Suggestion Responses", self.test_enhanced_conversation_break_suggestion)],
+            [("Enhanced Conversation Flow - Interaction Count Increment", self.test_enhanced_conversation_interaction_count)],
+            [("Session Management Integration - Start Ambient with Session Tracking", self.test_start_ambient_with_session_tracking)],
+            [("Session Management Integration - Session Store Maintenance", self.test_session_store_maintenance)],
+            [("Session Management Integration - Telemetry Events", self.test_session_management_telemetry_events)],
+            [("Error Handling", self.test_error_handling)],
             # CRITICAL VOICE PIPELINE TESTS
-            ("CRITICAL - Deepgram STT Nova 3 Integration", self.test_deepgram_stt_nova3),
-            ("CRITICAL - Deepgram TTS Aura 2 Integration", self.test_deepgram_tts_aura2),
-            ("CRITICAL - Wake Word Detection System", self.test_wake_word_detection),
-            ("CRITICAL - Ambient Listening Pipeline", self.test_ambient_listening_pipeline),
-            ("CRITICAL - Full Voice Pipeline End-to-End", self.test_full_voice_pipeline),
-            ("CRITICAL - Voice Personalities Configuration", self.test_voice_personalities_config),
-            ("CRITICAL - Audio Base64 Processing", self.test_audio_base64_processing),
-            ("CRITICAL - Wake Word Variants", self.test_wake_word_variants),
-            ("CRITICAL - Voice Session Management", self.test_voice_session_management),
-            ("CRITICAL - TTS Audio Quality", self.test_tts_audio_quality),
+            [("CRITICAL - Deepgram STT Nova 3 Integration", self.test_deepgram_stt_nova3)],
+            [("CRITICAL - Deepgram TTS Aura 2 Integration", self.test_deepgram_tts_aura2)],
+            [("CRITICAL - Wake Word Detection System", self.test_wake_word_detection)],
+            [("CRITICAL - Ambient Listening Pipeline", self.test_ambient_listening_pipeline)],
+            [("CRITICAL - Full Voice Pipeline End-to-End", self.test_full_voice_pipeline)],
+            [("CRITICAL - Voice Personalities Configuration", self.test_voice_personalities_config)],
+            [("CRITICAL - Audio Base64 Processing", self.test_audio_base64_processing)],
+            [("CRITICAL - Wake Word Variants", self.test_wake_word_variants)],
+            [("CRITICAL - Voice Session Management", self.test_voice_session_management)],
+            [("CRITICAL - TTS Audio Quality", self.test_tts_audio_quality)],
             # CONTENT LIBRARY EXPANSION TESTS
-            ("Content Library - Stories Testing", self.test_stories_content_library),
-            ("Content Library - Songs Testing", self.test_songs_content_library),
-            ("Content Library - Rhymes Testing", self.test_rhymes_content_library),
-            ("Content Library - Interactive Games Testing", self.test_interactive_games_content_library),
-            ("Content Library - Jokes & Riddles Testing", self.test_jokes_riddles_content_library),
-            ("Content Library - Quality Verification", self.test_content_quality_verification),
-            ("Content Library - Age Appropriateness", self.test_age_appropriate_filtering),
-            ("Content Library - Local First Fallback", self.test_local_first_fallback),
-            ("Content Library - Engagement Features", self.test_engagement_features),
+            [("Content Library - Stories Testing", self.test_stories_content_library)],
+            [("Content Library - Songs Testing", self.test_songs_content_library)],
+            [("Content Library - Rhymes Testing", self.test_rhymes_content_library)],
+            [("Content Library - Interactive Games Testing", self.test_interactive_games_content_library)],
+            [("Content Library - Jokes & Riddles Testing", self.test_jokes_riddles_content_library)],
+            [("Content Library - Quality Verification", self.test_content_quality_verification)],
+            [("Content Library - Age Appropriateness", self.test_age_appropriate_filtering)],
+            [("Content Library - Local First Fallback", self.test_local_first_fallback)],
+            [("Content Library - Engagement Features", self.test_engagement_features)],
+            # Exhausts the session's hourly interaction budget, so it runs after every content test
+            [("Session Management - Rate Limit Mic Lock", self.test_rate_limit_mic_lock)],
             # NEW CONTENT API ENDPOINTS TESTS - STORIES PAGE REGRESSION FIX
-            ("Content API - Stories Endpoint", self.test_content_api_stories),
-            ("Content API - Content Type Endpoints", self.test_content_api_content_types),
-            ("Content API - Generate Content Endpoint", self.test_content_api_generate),
+            [("Content API - Stories Endpoint", self.test_content_api_stories)],
+            [("Content API - Content Type Endpoints", self.test_content_api_content_types)],
+            [("Content API - Generate Content Endpoint", self.test_content_api_generate)],
             
             # CRITICAL CONVERSATION CONTINUITY TESTS - OCTOPUS SCENARIO FIX
-            ("CRITICAL - Octopus Scenario Recreation", self.test_octopus_scenario_recreation),
-            ("CRITICAL - Context Detection System", self.test_context_detection_system),
-            ("CRITICAL - Simple Response Handling", self.test_simple_response_handling),
-            ("CRITICAL - Conversation History Storage", self.test_conversation_history_storage),
-            ("CRITICAL - Follow-Through Pattern Detection", self.test_followthrough_pattern_detection),
-            ("CRITICAL - Enhanced Logging Analysis", self.test_enhanced_logging_analysis),
+            [("CRITICAL - Octopus Scenario Recreation", self.test_octopus_scenario_recreation)],
+            [("CRITICAL - Context Detection System", self.test_context_detection_system)],
+            [("CRITICAL - Simple Response Handling", self.test_simple_response_handling)],
+            [("CRITICAL - Conversation History Storage", self.test_conversation_history_storage)],
+            [("CRITICAL - Follow-Through Pattern Detection", self.test_followthrough_pattern_detection)],
+            [("CRITICAL - Enhanced Logging Analysis", self.test_enhanced_logging_analysis)],
             
             # JSON VALIDATION AND CONVERSATION CONTEXT TESTS - REQUESTED BY USER
-            ("JSON VALIDATION - Conversation Text Endpoint JSON Response", self.test_conversation_text_json_validation),
-            ("CONTEXT TEST - Riddle Conversation Follow-Through", self.test_riddle_conversation_context),
-            ("CONTEXT TEST - Question Conversation Context Maintenance", self.test_question_conversation_context),
-            ("MEMORY TEST - Memory System Working Correctly", self.test_memory_system_working),
-            ("JSON EDGE CASES - Serialization Edge Cases", self.test_json_serialization_edge_cases)
+            [("JSON VALIDATION - Conversation Text Endpoint JSON Response", self.test_conversation_text_json_validation)],
+            [("CONTEXT TEST - Riddle Conversation Follow-Through", self.test_riddle_conversation_context)],
+            [("CONTEXT TEST - Question Conversation Context Maintenance", self.test_question_conversation_context)],
+            [("MEMORY TEST - Memory System Working Correctly", self.test_memory_system_working)],
+            [("JSON EDGE CASES - Serialization Edge Cases", self.test_json_serialization_edge_cases)]
         ]
         
-        for test_name, test_func in test_sequence:
-            try:
-                logger.info(f"Running test: {test_name}")
-                result = await test_func()
-                self.test_results[test_name] = {
-                    "status": "PASS" if result else "FAIL",
-                    "details": result if isinstance(result, dict) else {"success": result}
-                }
-                logger.info(f"Test {test_name}: {'PASS' if result else 'FAIL'}")
-            except Exception as e:
-                logger.error(f"Test {test_name} failed with exception: {str(e)}")
-                self.test_results[test_name] = {
-                    "status": "ERROR",
-                    "details": {"error": str(e)}
-                }
+        for tier in test_tiers:
+            if len(tier) > 1:
+                logger.info(f"Running {len(tier)} tests concurrently: {', '.join(name for name, _ in tier)}")
+                # Stragglers in a concurrent tier are cancelled instead of holding it open
+                async with asyncio.TaskGroup() as group:
+                    tasks = [group.create_task(self._run_one(name, func, TIER_TEST_TIMEOUT)) for name, func in tier]
+                outcomes = [task.result() for task in tasks]
+            else:
+                outcomes = [await self._run_one(*tier[0])]
+            for test_name, result in outcomes:
+                self.test_results[test_name] = result
         
         return self.test_results
     
-    async def test_health_check(self):
-        """Test health check endpoint"""
-        try:
-            async with self.session.get(f"{BACKEND_URL}/health") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    logger.info(f"Health check response: {data}")
-                    
-                    # Verify expected structure
-                    required_keys = ["status", "agents", "database"]
-                    if all(key in data for key in required_keys):
-                        return {
-                            "success": True,
-                            "status": data["status"],
-                            "agents_initialized": data["agents"]["orchestrator"],
-                            "gemini_configured": data["agents"]["gemini_configured"],
-                            "deepgram_configured": data["agents"]["deepgram_configured"],
-                            "database": data["database"]
-                        }
-                    else:
-                        return {"success": False, "error": "Missing required keys in response"}
-                else:
-                    return {"success": False, "error": f"HTTP {response.status}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_create_user_profile(self):
-        """Test user profile creation"""
+    async def _run_one(self, test_name, test_func, timeout=None):
+        """Run a single test and return its name with a recorded result"""
         try:
-            profile_data = {
-                "name": "Emma",
-                "age": 7,
-                "location": "New York",
-                "timezone": "America/New_York",
-                "language": "english",
-                "voice_personality": "friendly_companion",
-                "interests": ["stories", "animals", "music"],
-                "learning_goals": ["reading", "counting"],
-                "parent_email": "parent@example.com"
+            logger.info(f"Running test: {test_name}")
+            async with asyncio.timeout(timeout):
+                result = await test_func()
+            logger.info(f"Test {test_name}: {'PASS' if result else 'FAIL'}")
+            return test_name, {
+                "status": "PASS" if result else "FAIL",
+                "details": result if isinstance(result, dict) else {"success": result}
+            }
+        except TimeoutError:
+            logger.error(f"Test {test_name} timed out after {timeout}s")
+            return test_name, {
+                "status": "ERROR",
+                "details": {"error": f"Timed out after {timeout}s"}
             }
-            
-            async with self.session.post(
-                f"{BACKEND_URL}/users/profile",
-                json=profile_data
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self.test_user_id = data["id"]  # Store for other tests
-                    logger.info(f"Created user profile with ID: {self.test_user_id}")
-                    
-                    # Verify profile data
-                    return {
-                        "success": True,
-                        "user_id": data["id"],
-                        "name": data["name"],
-                        "age": data["age"],
-                        "created": True
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            logger.error(f"Test {test_name} failed with exception: {str(e)}")
+            return test_name, {
+                "status": "ERROR",
+                "details": {"error": str(e)}
+            }
     
-    async def test_get_user_profile(self):
-        """Test user profile retrieval"""
-        if not self.test_user_id:
-            return {"success": False, "error": "No test user ID available"}
-        
-        try:
-            async with self.session.get(
-                f"{BACKEND_URL}/users/profile/{self.test_user_id}"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "user_id": data["id"],
-                        "name": data["name"],
-                        "age": data["age"],
-                        "interests": data["interests"]
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+    def _url(self, path):
+        """Parsed endpoint URL, built once per path so aiohttp skips re-parsing"""
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = URL(f"{BACKEND_URL}{path}", encoded=True)
+        return url
     
-    async def test_update_user_profile(self):
-        """Test user profile update"""
-        if not self.test_user_id:
-            return {"success": False, "error": "No test user ID available"}
+    def _get_test(self, test_name):
+        """Bind a GET_TESTS entry to the generic GET runner"""
+        return functools.partial(self._run_get, *GET_TESTS[test_name], STASHED_GET_TESTS.get(test_name))
+    
+    async def _run_get(self, path, extract, stash=None):
+        """GET an endpoint and summarise its JSON body, keeping it on self.<stash> if given"""
+        if "{user_id}" in path:
+            if not self.test_user_id:
+                return {"success": False, "error": "No test user ID available"}
+            path = path.format(user_id=self.test_user_id)
         
-        try:
-            update_data = {
-                "interests": ["stories", "animals", "music", "science"],
-                "learning_goals": ["reading", "counting", "colors"]
-            }
-            
-            async with self.session.put(
-                f"{BACKEND_URL}/users/profile/{self.test_user_id}",
-                json=update_data
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "updated_interests": data["interests"],
-                        "updated_goals": data["learning_goals"]
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        def summarise(data):
+            if stash:
+                setattr(self, stash, data)
+            return _summarise(extract, data)
+        
+        return await self._request_test("GET", path, {}, lambda self, data: summarise(data))
     
-    async def test_get_parental_controls(self):
-        """Test parental controls retrieval"""
+    async def _request_test(self, method, path, kwargs, extract):
+        """Issue one request and summarise a 200 JSON body with extract(self, data)"""
+        # Idempotent requests ride out transient gateway errors instead of failing the run
+        attempts = RETRY_ATTEMPTS if method in RETRY_METHODS else 1
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                async with self.session.request(method, self._url(path), **kwargs) as response:
+                    if response.status == 200:
+                        return {"success": True, **extract(self, await _json(response))}
+                    elif response.status not in RETRY_STATUSES or last_attempt:
+                        error_text = await response.text()
+                        return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
+            except aiohttp.ClientConnectionError as e:
+                if last_attempt:
+                    return {"success": False, "error": str(e)}
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt * (0.5 + random.random()))
+    
+    def _profile_created(self, data):
+        self.test_user_id = data["id"]  # Store for other tests
+        logger.info(f"Created user profile with ID: {self.test_user_id}")
+        return {
+            "user_id": data["id"],
+            "name": data["name"],
+            "age": data["age"],
+            "created": True
+        }
+    
+    @http_test(_profile_created)
+    def test_create_user_profile(self):
+        """Test user profile creation"""
+        profile_data = {
+            "name": "Emma",
+            "age": 7,
+            "location": "New York",
+            "timezone": "America/New_York",
+            "language": "english",
+            "voice_personality": "friendly_companion",
+            "interests": ["stories", "animals", "music"],
+            "learning_goals": ["reading", "counting"],
+            "parent_email": "parent@example.com"
+        }
+        return "POST", "/users/profile", {"json": profile_data}
+    
+    def _profile_updated(self, data):
+        # Fields the update leaves alone should match the profile fetched before it
+        before = self._profile
+        return {
+            "updated_interests": data["interests"],
+            "updated_goals": data["learning_goals"],
+            "untouched_fields_preserved": (
+                _UNTOUCHED_PROFILE_FIELDS(data) == _UNTOUCHED_PROFILE_FIELDS(before) if before else None
+            )
+        }
+    
+    @http_test(_profile_updated)
+    def test_update_user_profile(self):
+        """Test user profile update"""
         if not self.test_user_id:
             return {"success": False, "error": "No test user ID available"}
         
-        try:
-            async with self.session.get(
-                f"{BACKEND_URL}/users/{self.test_user_id}/parental-controls"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "user_id": data["user_id"],
-                        "time_limits": data["time_limits"],
-                        "monitoring_enabled": data["monitoring_enabled"],
-                        "allowed_content_types": data["allowed_content_types"]
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        update_data = {
+            "interests": ["stories", "animals", "music", "science"],
+            "learning_goals": ["reading", "counting", "colors"]
+        }
+        return "PUT", f"/users/profile/{self.test_user_id}", {"json": update_data}
     
-    async def test_update_parental_controls(self):
+    @http_test(lambda self, d: {
+        "updated_time_limits": d["time_limits"],
+        "updated_restrictions": d["content_restrictions"]
+    })
+    def test_update_parental_controls(self):
         """Test parental controls update"""
         if not self.test_user_id:
             return {"success": False, "error": "No test user ID available"}
         
-        try:
-            update_data = {
-                "time_limits": {
-                    "monday": 45,
-                    "tuesday": 45,
-                    "wednesday": 45,
-                    "thursday": 45,
-                    "friday": 60,
-                    "saturday": 90,
-                    "sunday": 90
-                },
-                "content_restrictions": ["violence", "scary"],
-                "monitoring_enabled": True
-            }
-            
-            async with self.session.put(
-                f"{BACKEND_URL}/users/{self.test_user_id}/parental-controls",
-                json=update_data
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "updated_time_limits": data["time_limits"],
-                        "updated_restrictions": data["content_restrictions"]
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        update_data = {
+            "time_limits": {
+                "monday": 45,
+                "tuesday": 45,
+                "wednesday": 45,
+                "thursday": 45,
+                "friday": 60,
+                "saturday": 90,
+                "sunday": 90
+            },
+            "content_restrictions": ["violence", "scary"],
+            "monitoring_enabled": True
+        }
+        return "PUT", f"/users/{self.test_user_id}/parental-controls", {"json": update_data}
     
-    async def test_create_conversation_session(self):
+    def _session_created(self, data):
+        self.test_session_id = data["id"]  # Store for other tests
+        return {
+            "session_id": data["id"],
+            "user_id": data["user_id"],
+            "session_name": data["session_name"]
+        }
+    
+    @http_test(_session_created)
+    def test_create_conversation_session(self):
         """Test conversation session creation"""
         if not self.test_user_id:
             return {"success": False, "error": "No test user ID available"}
         
-        try:
-            session_data = {
-                "user_id": self.test_user_id,
-                "session_name": "Test Chat Session"
-            }
-            
-            async with self.session.post(
-                f"{BACKEND_URL}/conversations/session",
-                json=session_data
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self.test_session_id = data["id"]  # Store for other tests
-                    return {
-                        "success": True,
-                        "session_id": data["id"],
-                        "user_id": data["user_id"],
-                        "session_name": data["session_name"]
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        session_data = {
+            "user_id": self.test_user_id,
+            "session_name": "Test Chat Session"
+        }
+        return "POST", "/conversations/session", {"json": session_data}
     
-    async def test_text_conversation(self):
+    @http_test(lambda self, d: {
+        "response_received": bool(d.get("response_text")),
+        "content_type": d.get("content_type"),
+        "has_audio": bool(d.get("response_audio")),
+        "response_length": len(d.get("response_text", ""))
+    })
+    def test_text_conversation(self):
         """Test text conversation processing"""
         if not self.test_user_id or not self.test_session_id:
             return {"success": False, "error": "Missing test user ID or session ID"}
         
-        try:
-            text_input = {
-                "session_id": self.test_session_id,
-                "user_id": self.test_user_id,
-                "message": "Hi! Can you tell me a story about a friendly animal?"
-            }
-            
-            async with self.session.post(
-                f"{BACKEND_URL}/conversations/text",
-                json=text_input
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "response_received": bool(data.get("response_text")),
-                        "content_type": data.get("content_type"),
-                        "has_audio": bool(data.get("response_audio")),
-                        "response_length": len(data.get("response_text", ""))
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        text_input = {
+            "session_id": self.test_session_id,
+            "user_id": self.test_user_id,
+            "message": "Hi! Can you tell me a story about a friendly animal?"
+        }
+        return "POST", "/conversations/text", {"json": text_input}
     
     async def test_voice_conversation(self):
         """Test voice conversation processing with mock audio"""
@@ -406,14 +868,10 @@ class BackendTester:
             return {"success": False, "error": "Missing test user ID or session ID"}
         
         try:
-            # Create mock audio data (base64 encoded)
-            mock_audio = b"mock_audio_data_for_testing"
-            audio_base64 = base64.b64encode(mock_audio).decode('utf-8')
-            
             voice_input = {
                 "session_id": self.test_session_id,
                 "user_id": self.test_user_id,
-                "audio_base64": audio_base64
+                "audio_base64": self._MOCK_AUDIO_B64
             }
             
             async with self.session.post(
@@ -422,7 +880,7 @@ class BackendTester:
             ) as response:
                 # Voice processing might fail due to mock data, but we test the endpoint
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     return {
                         "success": True,
                         "endpoint_accessible": True,
@@ -442,29 +900,6 @@ class BackendTester:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    async def test_content_suggestions(self):
-        """Test content suggestions endpoint"""
-        if not self.test_user_id:
-            return {"success": False, "error": "No test user ID available"}
-        
-        try:
-            async with self.session.get(
-                f"{BACKEND_URL}/content/suggestions/{self.test_user_id}"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "suggestions_count": len(data),
-                        "has_suggestions": len(data) > 0,
-                        "suggestion_types": [item.get("content_type") for item in data] if data else []
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
     async def test_content_by_type(self):
         """Test content by type endpoint"""
         if not self.test_user_id:
@@ -472,22 +907,23 @@ class BackendTester:
         
         try:
             content_types = ["story", "song", "educational"]
-            results = {}
             
-            for content_type in content_types:
+            async def fetch(content_type):
                 async with self.session.get(
-                    f"{BACKEND_URL}/content/{content_type}/{self.test_user_id}"
+                    self._url(f"/content/{content_type}/{self.test_user_id}")
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        results[content_type] = {
+                        data = await _json(response)
+                        return content_type, {
                             "available": True,
                             "content_count": len(data) if isinstance(data, list) else 1
                         }
                     elif response.status == 404:
-                        results[content_type] = {"available": False, "reason": "No content found"}
+                        return content_type, {"available": False, "reason": "No content found"}
                     else:
-                        results[content_type] = {"available": False, "error": f"HTTP {response.status}"}
+                        return content_type, {"available": False, "error": f"HTTP {response.status}"}
+            
+            results = dict(await asyncio.gather(*(fetch(ct) for ct in content_types)))
             
             return {
                 "success": True,
@@ -497,240 +933,61 @@ class BackendTester:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    async def test_voice_personalities(self):
-        """Test voice personalities endpoint"""
-        try:
-            async with self.session.get(f"{BACKEND_URL}/voice/personalities") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "personalities_count": len(data),
-                        "available_personalities": list(data.keys()) if isinstance(data, dict) else [],
-                        "has_descriptions": all("description" in v for v in data.values()) if isinstance(data, dict) else False
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_memory_snapshot_generation(self):
-        """Test memory snapshot generation endpoint"""
-        if not self.test_user_id:
-            return {"success": False, "error": "No test user ID available"}
-        
-        try:
-            async with self.session.post(
-                f"{BACKEND_URL}/memory/snapshot/{self.test_user_id}"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "user_id": data.get("user_id"),
-                        "snapshot_created": bool(data.get("date")),
-                        "has_summary": bool(data.get("summary")),
-                        "has_insights": bool(data.get("insights")),
-                        "total_interactions": data.get("total_interactions", 0)
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_memory_context_retrieval(self):
-        """Test memory context retrieval endpoint"""
-        if not self.test_user_id:
-            return {"success": False, "error": "No test user ID available"}
-        
-        try:
-            async with self.session.get(
-                f"{BACKEND_URL}/memory/context/{self.test_user_id}?days=7"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "user_id": data.get("user_id", self.test_user_id),
-                        "has_memory_context": bool(data.get("memory_context") or data.get("recent_preferences")),
-                        "context_type": type(data.get("memory_context", "")).__name__,
-                        "has_preferences": bool(data.get("recent_preferences")),
-                        "has_topics": bool(data.get("favorite_topics"))
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_memory_snapshots_history(self):
-        """Test memory snapshots history endpoint"""
-        if not self.test_user_id:
-            return {"success": False, "error": "No test user ID available"}
-        
-        try:
-            async with self.session.get(
-                f"{BACKEND_URL}/memory/snapshots/{self.test_user_id}?days=30"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "user_id": data.get("user_id"),
-                        "snapshots_count": data.get("count", 0),
-                        "has_snapshots": bool(data.get("snapshots")),
-                        "snapshots_structure": bool(isinstance(data.get("snapshots"), list))
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_enhanced_conversation_with_memory(self):
-        """Test enhanced conversation flow with memory context"""
-        if not self.test_user_id or not self.test_session_id:
-            return {"success": False, "error": "Missing test user ID or session ID"}
-        
-        try:
-            # First, generate a memory snapshot to have context
-            await self.session.post(f"{BACKEND_URL}/memory/snapshot/{self.test_user_id}")
-            
-            # Now test conversation with memory context
-            text_input = {
-                "session_id": self.test_session_id,
-                "user_id": self.test_user_id,
-                "message": "Remember what we talked about before? I'd like to hear another story like that."
-            }
-            
-            async with self.session.post(
-                f"{BACKEND_URL}/conversations/text",
-                json=text_input
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    metadata = data.get("metadata", {})
-                    return {
-                        "success": True,
-                        "response_received": bool(data.get("response_text")),
-                        "has_memory_context": bool(metadata.get("memory_context")),
-                        "has_emotional_state": bool(metadata.get("emotional_state")),
-                        "has_dialogue_plan": bool(metadata.get("dialogue_plan")),
-                        "content_type": data.get("content_type"),
-                        "response_length": len(data.get("response_text", ""))
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_analytics_dashboard(self):
-        """Test analytics dashboard endpoint"""
-        if not self.test_user_id:
-            return {"success": False, "error": "No test user ID available"}
-        
-        try:
-            async with self.session.get(
-                f"{BACKEND_URL}/analytics/dashboard/{self.test_user_id}?days=7"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "has_date_range": bool(data.get("date_range")),
-                        "total_users": data.get("total_users", 0),
-                        "total_sessions": data.get("total_sessions", 0),
-                        "total_interactions": data.get("total_interactions", 0),
-                        "has_feature_usage": bool(data.get("feature_usage")),
-                        "has_daily_breakdown": bool(data.get("daily_breakdown")),
-                        "has_engagement_trends": bool(data.get("engagement_trends"))
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_global_analytics(self):
-        """Test global analytics endpoint"""
-        try:
-            async with self.session.get(
-                f"{BACKEND_URL}/analytics/global?days=7"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "has_date_range": bool(data.get("date_range")),
-                        "total_users": data.get("total_users", 0),
-                        "total_sessions": data.get("total_sessions", 0),
-                        "total_interactions": data.get("total_interactions", 0),
-                        "has_feature_usage": bool(data.get("feature_usage")),
-                        "has_engagement_trends": bool(data.get("engagement_trends")),
-                        "analytics_structure": "global"
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_user_feature_flags(self):
-        """Test user feature flags endpoint"""
-        if not self.test_user_id:
-            return {"success": False, "error": "No test user ID available"}
-        
-        try:
-            async with self.session.get(
-                f"{BACKEND_URL}/flags/{self.test_user_id}"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    flags = data.get("flags", {})
-                    return {
-                        "success": True,
-                        "user_id": data.get("user_id"),
-                        "flags_count": len(flags),
-                        "has_emoji_usage": "emoji_usage" in flags,
-                        "has_memory_snapshots": "memory_snapshots" in flags,
-                        "has_ambient_listening": "ambient_listening" in flags,
-                        "flags_structure": isinstance(flags, dict)
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+    def _snapshot_generated(self, data):
+        # "No interactions today" replies carry a date too, but nothing is stored for them
+        self._snapshot_created = data.get("total_interactions", 0) > 0
+        return {
+            "user_id": data.get("user_id"),
+            "snapshot_created": bool(data.get("date")),
+            "has_summary": bool(data.get("summary")),
+            "has_insights": bool(data.get("insights")),
+            "total_interactions": data.get("total_interactions", 0)
+        }
     
-    async def test_update_feature_flags(self):
-        """Test updating user feature flags"""
+    @http_test(_snapshot_generated)
+    def test_memory_snapshot_generation(self):
+        """Test memory snapshot generation endpoint"""
         if not self.test_user_id:
             return {"success": False, "error": "No test user ID available"}
         
+        return "POST", f"/memory/snapshot/{self.test_user_id}", {}
+    
+    async def test_enhanced_conversation_with_memory(self):
+        """Test enhanced conversation flow with memory context"""
+        if not self.test_user_id or not self.test_session_id:
+            return {"success": False, "error": "Missing test user ID or session ID"}
+        
         try:
-            # Test flags to update
-            test_flags = {
-                "emoji_usage": False,
-                "advanced_games": True,
-                "memory_snapshots": True,
-                "test_flag": True
+            # First, generate a memory snapshot to have context unless one already exists
+            if not self._snapshot_created:
+                async with self.session.post(
+                    f"{BACKEND_URL}/memory/snapshot/{self.test_user_id}"
+                ) as response:
+                    data = await _json(response) if response.status == 200 else {}
+                    self._snapshot_created = data.get("total_interactions", 0) > 0
+            
+            # Now test conversation with memory context
+            text_input = {
+                "session_id": self.test_session_id,
+                "user_id": self.test_user_id,
+                "message": "Remember what we talked about before? I'd like to hear another story like that."
             }
             
-            async with self.session.put(
-                f"{BACKEND_URL}/flags/{self.test_user_id}",
-                json=test_flags
+            async with self.session.post(
+                f"{BACKEND_URL}/conversations/text",
+                json=text_input
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
+                    metadata = data.get("metadata", {})
                     return {
                         "success": True,
-                        "user_id": data.get("user_id"),
-                        "flags_updated": data.get("flags"),
-                        "status": data.get("status"),
-                        "update_successful": data.get("status") == "updated"
+                        "response_received": bool(data.get("response_text")),
+                        "has_memory_context": bool(metadata.get("memory_context")),
+                        "has_emotional_state": bool(metadata.get("emotional_state")),
+                        "has_dialogue_plan": bool(metadata.get("dialogue_plan")),
+                        "content_type": data.get("content_type"),
+                        "response_length": len(data.get("response_text", ""))
                     }
                 else:
                     error_text = await response.text()
@@ -738,81 +995,54 @@ class BackendTester:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    async def test_session_end_telemetry(self):
+    @http_test(lambda self, d: {
+        "user_id": d.get("user_id"),
+        "flags_updated": d.get("flags"),
+        "status": d.get("status"),
+        "update_successful": d.get("status") == "updated"
+    })
+    def test_update_feature_flags(self):
+        """Test updating user feature flags"""
+        if not self.test_user_id:
+            return {"success": False, "error": "No test user ID available"}
+        
+        # Test flags to update
+        test_flags = {
+            "emoji_usage": False,
+            "advanced_games": True,
+            "memory_snapshots": True,
+            "test_flag": True
+        }
+        return "PUT", f"/flags/{self.test_user_id}", {"json": test_flags}
+    
+    @http_test(lambda self, d: {
+        "session_id": d.get("session_id"),
+        "has_duration": "duration" in d,
+        "has_interactions": "interactions" in d,
+        "has_engagement_score": "engagement_score" in d,
+        "has_summary": bool(d.get("summary")),
+        "telemetry_complete": bool(d.get("session_id"))
+    })
+    def test_session_end_telemetry(self):
         """Test session end telemetry endpoint"""
         if not self.test_session_id:
             return {"success": False, "error": "No test session ID available"}
         
-        try:
-            async with self.session.post(
-                f"{BACKEND_URL}/session/end/{self.test_session_id}"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "session_id": data.get("session_id"),
-                        "has_duration": "duration" in data,
-                        "has_interactions": "interactions" in data,
-                        "has_engagement_score": "engagement_score" in data,
-                        "has_summary": bool(data.get("summary")),
-                        "telemetry_complete": bool(data.get("session_id"))
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_agent_status_enhanced(self):
-        """Test agent status endpoint with memory and telemetry statistics"""
-        try:
-            async with self.session.get(f"{BACKEND_URL}/agents/status") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "orchestrator_active": data.get("orchestrator") == "active",
-                        "memory_agent_active": data.get("memory_agent") == "active",
-                        "telemetry_agent_active": data.get("telemetry_agent") == "active",
-                        "has_memory_statistics": bool(data.get("memory_statistics")),
-                        "has_telemetry_statistics": bool(data.get("telemetry_statistics")),
-                        "session_count": data.get("session_count", 0),
-                        "active_games": data.get("active_games", 0),
-                        "all_agents_count": len([k for k, v in data.items() if v == "active"])
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        return "POST", f"/session/end/{self.test_session_id}", {}
     
-    async def test_maintenance_cleanup(self):
+    @http_test(lambda self, d: {
+        "cleanup_executed": bool(d.get("memory_cleanup") or d.get("telemetry_cleanup")),
+        "has_memory_cleanup": "memory_cleanup" in d,
+        "has_telemetry_cleanup": "telemetry_cleanup" in d,
+        "cleanup_summary": d.get("summary", "No summary provided")
+    })
+    def test_maintenance_cleanup(self):
         """Test maintenance cleanup endpoint"""
-        try:
-            cleanup_params = {
-                "memory_days": 30,
-                "telemetry_days": 90
-            }
-            
-            async with self.session.post(
-                f"{BACKEND_URL}/maintenance/cleanup",
-                params=cleanup_params
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "success": True,
-                        "cleanup_executed": bool(data.get("memory_cleanup") or data.get("telemetry_cleanup")),
-                        "has_memory_cleanup": "memory_cleanup" in data,
-                        "has_telemetry_cleanup": "telemetry_cleanup" in data,
-                        "cleanup_summary": data.get("summary", "No summary provided")
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        cleanup_params = {
+            "memory_days": 30,
+            "telemetry_days": 90
+        }
+        return "POST", "/maintenance/cleanup", {"params": cleanup_params}
     
     async def test_ambient_listening_integration(self):
         """Test ambient listening integration with telemetry tracking"""
@@ -826,42 +1056,30 @@ class BackendTester:
                 "user_id": self.test_user_id
             }
             
-            async with self.session.post(
-                f"{BACKEND_URL}/ambient/start",
-                json=start_request
-            ) as response:
-                if response.status == 200:
-                    start_data = await response.json()
-                    
-                    # Test ambient status
-                    async with self.session.get(
-                        f"{BACKEND_URL}/ambient/status/{self.test_session_id}"
-                    ) as status_response:
-                        if status_response.status == 200:
-                            status_data = await status_response.json()
-                            
-                            # Test ambient stop
-                            stop_request = {"session_id": self.test_session_id}
-                            async with self.session.post(
-                                f"{BACKEND_URL}/ambient/stop",
-                                json=stop_request
-                            ) as stop_response:
-                                if stop_response.status == 200:
-                                    return {
-                                        "success": True,
-                                        "ambient_start": bool(start_data.get("status")),
-                                        "ambient_status": bool(status_data.get("session_id")),
-                                        "ambient_stop": stop_response.status == 200,
-                                        "listening_state": status_data.get("listening_state"),
-                                        "telemetry_tracked": True  # Implicit from successful operations
-                                    }
-                                else:
-                                    return {"success": False, "error": f"Stop failed: HTTP {stop_response.status}"}
-                        else:
-                            return {"success": False, "error": f"Status failed: HTTP {status_response.status}"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Start failed: HTTP {response.status}: {error_text}"}
+            # Each step releases its connection as soon as the body is read
+            status, start_data = await self._post_json("/ambient/start", start_request)
+            if status != 200:
+                return {"success": False, "error": f"Start failed: HTTP {status}: {start_data}"}
+            
+            # Test ambient status
+            status, status_data = await self._get_json(f"/ambient/status/{self.test_session_id}")
+            if status != 200:
+                return {"success": False, "error": f"Status failed: HTTP {status}"}
+            
+            # Test ambient stop
+            stop_request = {"session_id": self.test_session_id}
+            status, _ = await self._post_json("/ambient/stop", stop_request)
+            if status != 200:
+                return {"success": False, "error": f"Stop failed: HTTP {status}"}
+            
+            return {
+                "success": True,
+                "ambient_start": bool(start_data.get("status")),
+                "ambient_status": bool(status_data.get("session_id")),
+                "ambient_stop": True,
+                "listening_state": status_data.get("listening_state"),
+                "telemetry_tracked": True  # Implicit from successful operations
+            }
         except Exception as e:
             return {"success": False, "error": str(e)}
     
@@ -887,7 +1105,7 @@ class BackendTester:
                 data=form_data
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     return {
                         "success": True,
                         "endpoint_accessible": True,
@@ -903,7 +1121,7 @@ class BackendTester:
                 elif response.status == 500:
                     # Check if it's the old error or a new processing error
                     try:
-                        error_data = await response.json()
+                        error_data = await _json(response)
                         error_detail = error_data.get("detail", "")
                         
                         if "process_conversation" in error_detail:
@@ -976,7 +1194,7 @@ class BackendTester:
                 data=form_data
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     return {
                         "success": True,
                         "endpoint_accessible": True,
@@ -990,7 +1208,7 @@ class BackendTester:
                     }
                 elif response.status == 500:
                     # Expected for mock audio data - endpoint is accessible
-                    error_data = await response.json()
+                    error_data = await _json(response)
                     return {
                         "success": True,
                         "endpoint_accessible": True,
@@ -1102,7 +1320,7 @@ class BackendTester:
                         json=text_input
                     ) as response:
                         if response.status == 200:
-                            data = await response.json()
+                            data = await _json(response)
                             response_audio = data.get("response_audio")
                             
                             tts_results.append({
@@ -1229,7 +1447,7 @@ class BackendTester:
                 processing_time = end_time - start_time
                 
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     
                     return {
                         "success": True,
@@ -1252,7 +1470,7 @@ class BackendTester:
                     }
                 elif response.status == 500:
                     # Expected for mock data - but shows pipeline is working
-                    error_data = await response.json()
+                    error_data = await _json(response)
                     return {
                         "success": True,
                         "end_to_end_flow": "Pipeline accessible",
@@ -1296,13 +1514,13 @@ class BackendTester:
                 },
                 {
                     "name": "Missing session_id",
-                    "audio_base64": base64.b64encode(b"test_audio_data").decode('utf-8'),
+                    "audio_base64": self._TEST_AUDIO_B64,
                     "session_id": None,
                     "expected_error": True
                 },
                 {
                     "name": "Missing user_id",
-                    "audio_base64": base64.b64encode(b"test_audio_data").decode('utf-8'),
+                    "audio_base64": self._TEST_AUDIO_B64,
                     "user_id": None,
                     "expected_error": True
                 }
@@ -1326,7 +1544,7 @@ class BackendTester:
                         data=form_data
                     ) as response:
                         is_error = response.status >= 400
-                        response_data = await response.json() if response.status != 422 else {"error": "validation_error"}
+                        response_data = await _json(response) if response.status != 422 else {"error": "validation_error"}
                         
                         error_handling_results.append({
                             "test_case": test_case["name"],
@@ -1441,7 +1659,7 @@ class BackendTester:
                     "data": {
                         "session_id": "test_session_123",
                         "user_id": "test_user_456", 
-                        "audio_base64": base64.b64encode(b"test_audio_data").decode('utf-8')
+                        "audio_base64": self._TEST_AUDIO_B64
                     }
                 },
                 {
@@ -1449,7 +1667,7 @@ class BackendTester:
                     "data": {
                         "session_id": "very_long_session_id_" + "x" * 100,
                         "user_id": "test_user",
-                        "audio_base64": base64.b64encode(b"test_audio_data").decode('utf-8')
+                        "audio_base64": self._TEST_AUDIO_B64
                     }
                 },
                 {
@@ -1457,7 +1675,7 @@ class BackendTester:
                     "data": {
                         "session_id": "session-with-dashes_and_underscores.123",
                         "user_id": "user@example.com",
-                        "audio_base64": base64.b64encode(b"test_audio_data").decode('utf-8')
+                        "audio_base64": self._TEST_AUDIO_B64
                     }
                 }
             ]
@@ -1481,482 +1699,191 @@ class BackendTester:
                     form_data_results.append({
                         "test_case": test_case["name"],
                         "error": str(e),
-                        "form_data_processed": False,
-                        "data_accepted": False
-                    })
-                
-                await asyncio.sleep(0.1)
-            
-            successful_processing = [r for r in form_data_results if r.get("form_data_processed", False)]
-            
-            return {
-                "success": True,
-                "form_data_tests_run": len(form_data_tests),
-                "successful_processing": len(successful_processing),
-                "form_data_success_rate": f"{len(successful_processing)/len(form_data_tests)*100:.1f}%",
-                "form_data_results": form_data_results
-            }
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_error_handling(self):
-        """Test error handling for invalid requests"""
-        try:
-            error_tests = []
-            
-            # Test 1: Invalid user profile creation (age out of range)
-            try:
-                invalid_profile = {
-                    "name": "Test",
-                    "age": 15,  # Invalid age
-                    "location": "Test"
-                }
-                async with self.session.post(
-                    f"{BACKEND_URL}/users/profile",
-                    json=invalid_profile
-                ) as response:
-                    error_tests.append({
-                        "test": "invalid_age",
-                        "status": response.status,
-                        "handled_correctly": response.status in [400, 422]
-                    })
-            except Exception as e:
-                error_tests.append({"test": "invalid_age", "error": str(e)})
-            
-            # Test 2: Non-existent user profile
-            try:
-                fake_user_id = str(uuid.uuid4())
-                async with self.session.get(
-                    f"{BACKEND_URL}/users/profile/{fake_user_id}"
-                ) as response:
-                    error_tests.append({
-                        "test": "nonexistent_user",
-                        "status": response.status,
-                        "handled_correctly": response.status == 404
-                    })
-            except Exception as e:
-                error_tests.append({"test": "nonexistent_user", "error": str(e)})
-            
-            # Test 3: Invalid conversation input
-            try:
-                invalid_text = {
-                    "session_id": "invalid_session",
-                    "user_id": "invalid_user",
-                    "message": ""
-                }
-                async with self.session.post(
-                    f"{BACKEND_URL}/conversations/text",
-                    json=invalid_text
-                ) as response:
-                    error_tests.append({
-                        "test": "invalid_conversation",
-                        "status": response.status,
-                        "handled_correctly": response.status in [400, 404, 422]
-                    })
-            except Exception as e:
-                error_tests.append({"test": "invalid_conversation", "error": str(e)})
-            
-            return {
-                "success": True,
-                "error_tests": error_tests,
-                "properly_handled": sum(1 for test in error_tests if test.get("handled_correctly", False))
-            }
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_stories_content_library(self):
-        """Test the 5 engaging classic stories in the content library"""
-        if not self.test_user_id or not self.test_session_id:
-            return {"success": False, "error": "Missing test user ID or session ID"}
-        
-        try:
-            # Test specific story requests
-            story_requests = [
-                "Tell me a story about three little pigs",
-                "Tell me the story of Goldilocks",
-                "Tell me about the tortoise and the hare",
-                "Tell me about the ugly duckling",
-                "Tell me a story about Little Red Riding Hood"
-            ]
-            
-            story_results = []
-            
-            for i, request in enumerate(story_requests):
-                text_input = {
-                    "session_id": self.test_session_id,
-                    "user_id": self.test_user_id,
-                    "message": request
-                }
-                
-                async with self.session.post(
-                    f"{BACKEND_URL}/conversations/text",
-                    json=text_input
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        response_text = data.get("response_text", "")
-                        content_type = data.get("content_type", "")
-                        
-                        # Analyze story quality
-                        word_count = len(response_text.split())
-                        has_moral = any(moral_word in response_text.lower() for moral_word in 
-                                      ["moral", "lesson", "learned", "important", "remember", "wise"])
-                        has_engaging_ending = any(ending in response_text.lower() for ending in 
-                                                ["the end", "happily ever after", "lived happily", "and so"])
-                        
-                        story_results.append({
-                            "request": request,
-                            "story_detected": content_type == "story" or "story" in content_type,
-                            "word_count": word_count,
-                            "full_length": 400 <= word_count <= 800,
-                            "has_moral": has_moral,
-                            "has_engaging_ending": has_engaging_ending,
-                            "response_preview": response_text[:200] + "..." if len(response_text) > 200 else response_text
-                        })
-                    else:
-                        story_results.append({
-                            "request": request,
-                            "error": f"HTTP {response.status}",
-                            "story_detected": False
-                        })
-                
-                await asyncio.sleep(0.2)
-            
-            # Calculate success metrics
-            successful_stories = [r for r in story_results if r.get("story_detected", False)]
-            full_length_stories = [r for r in story_results if r.get("full_length", False)]
-            stories_with_morals = [r for r in story_results if r.get("has_moral", False)]
-            
-            return {
-                "success": True,
-                "total_stories_tested": len(story_requests),
-                "stories_detected": len(successful_stories),
-                "full_length_stories": len(full_length_stories),
-                "stories_with_morals": len(stories_with_morals),
-                "story_detection_rate": f"{len(successful_stories)/len(story_requests)*100:.1f}%",
-                "full_length_rate": f"{len(full_length_stories)/len(story_requests)*100:.1f}%",
-                "moral_inclusion_rate": f"{len(stories_with_morals)/len(story_requests)*100:.1f}%",
-                "detailed_results": story_results
-            }
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_songs_content_library(self):
-        """Test the 6 beloved classic songs in the content library"""
-        if not self.test_user_id or not self.test_session_id:
-            return {"success": False, "error": "Missing test user ID or session ID"}
-        
-        try:
-            # Test specific song requests
-            song_requests = [
-                "Sing Mary had a little lamb",
-                "Sing the wheels on the bus",
-                "Sing the ABC song",
-                "Sing Old MacDonald",
-                "Sing itsy bitsy spider",
-                "Sing Twinkle Twinkle Little Star"
-            ]
-            
-            song_results = []
-            
-            for i, request in enumerate(song_requests):
-                text_input = {
-                    "session_id": self.test_session_id,
-                    "user_id": self.test_user_id,
-                    "message": request
-                }
-                
-                async with self.session.post(
-                    f"{BACKEND_URL}/conversations/text",
-                    json=text_input
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        response_text = data.get("response_text", "")
-                        content_type = data.get("content_type", "")
-                        
-                        # Analyze song quality
-                        has_verses = response_text.count('\n') >= 3  # Multiple lines suggest verses
-                        has_actions = any(action in response_text.lower() for action in 
-                                        ["clap", "stomp", "jump", "dance", "move", "hands", "feet"])
-                        has_engaging_reaction = any(reaction in response_text.lower() for reaction in 
-                                                  ["let's sing", "come on", "together", "fun", "great job"])
-                        has_repetition = any(word in response_text.lower() for word in 
-                                           ["la la", "tra la", "again", "repeat", "chorus"])
-                        
-                        song_results.append({
-                            "request": request,
-                            "song_detected": content_type == "song" or "song" in content_type,
-                            "has_verses": has_verses,
-                            "has_actions": has_actions,
-                            "has_engaging_reaction": has_engaging_reaction,
-                            "has_repetition": has_repetition,
-                            "response_preview": response_text[:200] + "..." if len(response_text) > 200 else response_text
-                        })
-                    else:
-                        song_results.append({
-                            "request": request,
-                            "error": f"HTTP {response.status}",
-                            "song_detected": False
-                        })
+                        "form_data_processed": False,
+                        "data_accepted": False
+                    })
                 
-                await asyncio.sleep(0.2)
+                await asyncio.sleep(0.1)
             
-            # Calculate success metrics
-            successful_songs = [r for r in song_results if r.get("song_detected", False)]
-            songs_with_verses = [r for r in song_results if r.get("has_verses", False)]
-            songs_with_actions = [r for r in song_results if r.get("has_actions", False)]
+            successful_processing = [r for r in form_data_results if r.get("form_data_processed", False)]
             
             return {
                 "success": True,
-                "total_songs_tested": len(song_requests),
-                "songs_detected": len(successful_songs),
-                "songs_with_verses": len(songs_with_verses),
-                "songs_with_actions": len(songs_with_actions),
-                "song_detection_rate": f"{len(successful_songs)/len(song_requests)*100:.1f}%",
-                "verse_inclusion_rate": f"{len(songs_with_verses)/len(song_requests)*100:.1f}%",
-                "action_inclusion_rate": f"{len(songs_with_actions)/len(song_requests)*100:.1f}%",
-                "detailed_results": song_results
+                "form_data_tests_run": len(form_data_tests),
+                "successful_processing": len(successful_processing),
+                "form_data_success_rate": f"{len(successful_processing)/len(form_data_tests)*100:.1f}%",
+                "form_data_results": form_data_results
             }
             
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    async def test_rhymes_content_library(self):
-        """Test the 4 classic nursery rhymes in the content library"""
-        if not self.test_user_id or not self.test_session_id:
-            return {"success": False, "error": "Missing test user ID or session ID"}
-        
+    async def test_error_handling(self):
+        """Test error handling for invalid requests"""
         try:
-            # Test specific rhyme requests
-            rhyme_requests = [
-                "Tell me Humpty Dumpty",
-                "Say Jack and Jill",
-                "Recite Hickory Dickory Dock",
-                "Tell me Mary Had a Little Lamb"
-            ]
-            
-            rhyme_results = []
+            error_tests = []
             
-            for i, request in enumerate(rhyme_requests):
-                text_input = {
-                    "session_id": self.test_session_id,
-                    "user_id": self.test_user_id,
-                    "message": request
+            # Test 1: Invalid user profile creation (age out of range)
+            try:
+                invalid_profile = {
+                    "name": "Test",
+                    "age": 15,  # Invalid age
+                    "location": "Test"
                 }
-                
                 async with self.session.post(
-                    f"{BACKEND_URL}/conversations/text",
-                    json=text_input
+                    f"{BACKEND_URL}/users/profile",
+                    json=invalid_profile
                 ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        response_text = data.get("response_text", "")
-                        content_type = data.get("content_type", "")
-                        
-                        # Analyze rhyme quality
-                        has_rhyming = self._check_rhyming_pattern(response_text)
-                        has_full_version = len(response_text.split()) >= 20  # Full nursery rhymes are typically longer
-                        has_moral_lesson = any(lesson in response_text.lower() for lesson in 
-                                             ["careful", "lesson", "important", "remember", "wise", "learn"])
-                        
-                        rhyme_results.append({
-                            "request": request,
-                            "rhyme_detected": content_type == "rhyme" or "rhyme" in content_type or "nursery" in content_type,
-                            "has_rhyming": has_rhyming,
-                            "has_full_version": has_full_version,
-                            "has_moral_lesson": has_moral_lesson,
-                            "response_preview": response_text[:200] + "..." if len(response_text) > 200 else response_text
-                        })
-                    else:
-                        rhyme_results.append({
-                            "request": request,
-                            "error": f"HTTP {response.status}",
-                            "rhyme_detected": False
-                        })
-                
-                await asyncio.sleep(0.2)
-            
-            # Calculate success metrics
-            successful_rhymes = [r for r in rhyme_results if r.get("rhyme_detected", False)]
-            rhymes_with_patterns = [r for r in rhyme_results if r.get("has_rhyming", False)]
-            full_version_rhymes = [r for r in rhyme_results if r.get("has_full_version", False)]
-            
-            return {
-                "success": True,
-                "total_rhymes_tested": len(rhyme_requests),
-                "rhymes_detected": len(successful_rhymes),
-                "rhymes_with_patterns": len(rhymes_with_patterns),
-                "full_version_rhymes": len(full_version_rhymes),
-                "rhyme_detection_rate": f"{len(successful_rhymes)/len(rhyme_requests)*100:.1f}%",
-                "rhyming_pattern_rate": f"{len(rhymes_with_patterns)/len(rhyme_requests)*100:.1f}%",
-                "full_version_rate": f"{len(full_version_rhymes)/len(rhyme_requests)*100:.1f}%",
-                "detailed_results": rhyme_results
-            }
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    async def test_interactive_games_content_library(self):
-        """Test the 5 engaging interactive games in the content library"""
-        if not self.test_user_id or not self.test_session_id:
-            return {"success": False, "error": "Missing test user ID or session ID"}
-        
-        try:
-            # Test specific game requests
-            game_requests = [
-                "Let's play quick math",
-                "Let's play animal sounds",
-                "Let's play color hunt",
-                "Let's build a story",
-                "Let's play a guessing game"
-            ]
+                    error_tests.append({
+                        "test": "invalid_age",
+                        "status": response.status,
+                        "handled_correctly": response.status in [400, 422]
+                    })
+            except Exception as e:
+                error_tests.append({"test": "invalid_age", "error": str(e)})
             
-            game_results = []
+            # Test 2: Non-existent user profile
+            try:
+                fake_user_id = str(uuid.uuid4())
+                async with self.session.get(
+                    f"{BACKEND_URL}/users/profile/{fake_user_id}"
+                ) as response:
+                    error_tests.append({
+                        "test": "nonexistent_user",
+                        "status": response.status,
+                        "handled_correctly": response.status == 404
+                    })
+            except Exception as e:
+                error_tests.append({"test": "nonexistent_user", "error": str(e)})
             
-            for i, request in enumerate(game_requests):
-                text_input = {
-                    "session_id": self.test_session_id,
-                    "user_id": self.test_user_id,
-                    "message": request
+            # Test 3: Invalid conversation input
+            try:
+                invalid_text = {
+                    "session_id": "invalid_session",
+                    "user_id": "invalid_user",
+                    "message": ""
                 }
-                
                 async with self.session.post(
                     f"{BACKEND_URL}/conversations/text",
-                    json=text_input
+                    json=invalid_text
                 ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        response_text = data.get("response_text", "")
-                        content_type = data.get("content_type", "")
-                        
-                        # Analyze game quality
-                        has_clear_instructions = any(instruction in response_text.lower() for instruction in 
-                                                   ["let's", "here's how", "rules", "instructions", "first", "step"])
-                        has_enthusiastic_reaction = any(reaction in response_text.lower() for reaction in 
-                                                      ["great", "awesome", "fantastic", "wonderful", "excellent", "amazing"])
-                        has_interactive_elements = any(element in response_text.lower() for element in 
-                                                     ["your turn", "what do you", "can you", "try to", "guess"])
-                        is_educational = any(education in response_text.lower() for education in 
-                                           ["learn", "practice", "skill", "brain", "smart", "clever"])
-                        
-                        game_results.append({
-                            "request": request,
-                            "game_detected": content_type == "game" or "game" in content_type or "play" in content_type,
-                            "has_clear_instructions": has_clear_instructions,
-                            "has_enthusiastic_reaction": has_enthusiastic_reaction,
-                            "has_interactive_elements": has_interactive_elements,
-                            "is_educational": is_educational,
-                            "response_preview": response_text[:200] + "..." if len(response_text) > 200 else response_text
-                        })
-                    else:
-                        game_results.append({
-                            "request": request,
-                            "error": f"HTTP {response.status}",
-                            "game_detected": False
-                        })
-                
-                await asyncio.sleep(0.2)
-            
-            # Calculate success metrics
-            successful_games = [r for r in game_results if r.get("game_detected", False)]
-            games_with_instructions = [r for r in game_results if r.get("has_clear_instructions", False)]
-            interactive_games = [r for r in game_results if r.get("has_interactive_elements", False)]
+                    error_tests.append({
+                        "test": "invalid_conversation",
+                        "status": response.status,
+                        "handled_correctly": response.status in [400, 404, 422]
+                    })
+            except Exception as e:
+                error_tests.append({"test": "invalid_conversation", "error": str(e)})
             
             return {
                 "success": True,
-                "total_games_tested": len(game_requests),
-                "games_detected": len(successful_games),
-                "games_with_instructions": len(games_with_instructions),
-                "interactive_games": len(interactive_games),
-                "game_detection_rate": f"{len(successful_games)/len(game_requests)*100:.1f}%",
-                "instruction_rate": f"{len(games_with_instructions)/len(game_requests)*100:.1f}%",
-                "interactivity_rate": f"{len(interactive_games)/len(game_requests)*100:.1f}%",
-                "detailed_results": game_results
+                "error_tests": error_tests,
+                "properly_handled": sum(1 for test in error_tests if test.get("handled_correctly", False))
             }
-            
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    async def test_stories_content_library(self):
+        """Test the 5 engaging classic stories in the content library"""
+        return await self._run_content_library("story")
+    
+    async def test_songs_content_library(self):
+        """Test the 6 beloved classic songs in the content library"""
+        return await self._run_content_library("song")
+    
+    async def test_rhymes_content_library(self):
+        """Test the 4 classic nursery rhymes in the content library"""
+        return await self._run_content_library("rhyme")
+    
+    async def test_interactive_games_content_library(self):
+        """Test the 5 engaging interactive games in the content library"""
+        return await self._run_content_library("game")
+    
     async def test_jokes_riddles_content_library(self):
         """Test jokes and riddles content in the library"""
+        return await self._run_content_library("joke_riddle")
+    
+    def _text_input_body(self, prompt):
+        """text_input JSON bytes; the ids are encoded once, only the message per prompt"""
+        ids = (self.test_session_id, self.test_user_id)
+        if ids != self._text_prefix_ids:
+            self._text_prefix = _json_bytes({"session_id": ids[0], "user_id": ids[1]})[:-1]
+            self._text_prefix_ids = ids
+        return self._text_prefix + b',"message":' + _json_bytes(prompt) + b'}'
+    
+    async def _fetch_content(self, prompt):
+        """POST a content prompt; returns (status, response_text, content_type)"""
+        await self.rate.acquire()
+        async with self.session.post(
+            f"{BACKEND_URL}/conversations/text",
+            data=self._text_input_body(prompt),
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status != 200:
+                return response.status, "", ""
+            data = await _json(response, CONTENT_RESPONSE_MAX_BYTES)
+            return 200, data.get("response_text", ""), data.get("content_type", "")
+    
+    async def _get_json(self, path):
+        """GET path; returns (status, decoded JSON on 200 else the error text)"""
+        async with self.session.get(self._url(path)) as response:
+            if response.status == 200:
+                return response.status, await _json(response)
+            return response.status, await response.text()
+    
+    async def _post_json(self, path, body=None):
+        """POST body as JSON; returns (status, decoded JSON on 200 else the error text)"""
+        async with self.session.post(self._url(path), json=body) as response:
+            if response.status == 200:
+                return response.status, await _json(response)
+            return response.status, await response.text()
+    
+    async def _run_content_library(self, category):
+        """Send a category's prompts concurrently and score each response"""
         if not self.test_user_id or not self.test_session_id:
             return {"success": False, "error": "Missing test user ID or session ID"}
         
+        spec = CONTENT_LIBRARY_TESTS[category]
         try:
-            # Test specific joke and riddle requests
-            joke_riddle_requests = [
-                "Tell me a joke",
-                "Make me laugh",
-                "Tell me a riddle",
-                "Give me a brain teaser",
-                "Tell me something funny",
-                "Share an amazing fact"
-            ]
-            
-            joke_riddle_results = []
+            async def fetch(request):
+                try:
+                    status, response_text, content_type = await self._fetch_content(request)
+                except ResponseTooLarge:
+                    return {"request": request, "error": "response too large", spec.detected_key: False}
+                if status == 200:
+                    return {
+                        "request": request,
+                        spec.detected_key: spec.detect(content_type),
+                        **spec.analyze(response_text),
+                        "response_preview": response_text[:200] + "..." if len(response_text) > 200 else response_text
+                    }
+                else:
+                    return {
+                        "request": request,
+                        "error": f"HTTP {status}",
+                        spec.detected_key: False
+                    }
             
-            for i, request in enumerate(joke_riddle_requests):
-                text_input = {
-                    "session_id": self.test_session_id,
-                    "user_id": self.test_user_id,
-                    "message": request
-                }
-                
-                async with self.session.post(
-                    f"{BACKEND_URL}/conversations/text",
-                    json=text_input
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        response_text = data.get("response_text", "")
-                        content_type = data.get("content_type", "")
-                        
-                        # Analyze joke/riddle quality
-                        is_age_appropriate = not any(inappropriate in response_text.lower() for inappropriate in 
-                                                   ["scary", "violent", "adult", "inappropriate"])
-                        has_interactive_riddle = any(riddle_element in response_text.lower() for riddle_element in 
-                                                   ["what am i", "guess", "riddle", "answer", "think"])
-                        has_celebration = any(celebration in response_text.lower() for celebration in 
-                                            ["great job", "correct", "well done", "amazing", "fantastic"])
-                        has_enthusiastic_reaction = any(reaction in response_text.lower() for reaction in 
-                                                      ["wow", "amazing", "incredible", "fantastic", "cool"])
-                        
-                        joke_riddle_results.append({
-                            "request": request,
-                            "content_detected": any(ct in content_type for ct in ["joke", "riddle", "fact", "fun"]),
-                            "is_age_appropriate": is_age_appropriate,
-                            "has_interactive_riddle": has_interactive_riddle,
-                            "has_celebration": has_celebration,
-                            "has_enthusiastic_reaction": has_enthusiastic_reaction,
-                            "response_preview": response_text[:200] + "..." if len(response_text) > 200 else response_text
-                        })
-                    else:
-                        joke_riddle_results.append({
-                            "request": request,
-                            "error": f"HTTP {response.status}",
-                            "content_detected": False
-                        })
-                
-                await asyncio.sleep(0.2)
+            results = await _gather_bounded((fetch(request) for request in spec.prompts), CONTENT_LIBRARY_CONCURRENCY)
             
             # Calculate success metrics
-            successful_content = [r for r in joke_riddle_results if r.get("content_detected", False)]
-            age_appropriate_content = [r for r in joke_riddle_results if r.get("is_age_appropriate", False)]
-            interactive_content = [r for r in joke_riddle_results if r.get("has_interactive_riddle", False)]
+            total = len(spec.prompts)
+            counts = dict.fromkeys((count_key for count_key, _, _ in spec.metrics), 0)
+            for r in results:
+                for count_key, _, flag in spec.metrics:
+                    if r.get(flag, False):
+                        counts[count_key] += 1
+            rates = {
+                rate_key: f"{counts[count_key]/total*100:.1f}%"
+                for count_key, rate_key, _ in spec.metrics
+            }
             
             return {
                 "success": True,
-                "total_requests_tested": len(joke_riddle_requests),
-                "content_detected": len(successful_content),
-                "age_appropriate_content": len(age_appropriate_content),
-                "interactive_content": len(interactive_content),
-                "content_detection_rate": f"{len(successful_content)/len(joke_riddle_requests)*100:.1f}%",
-                "age_appropriate_rate": f"{len(age_appropriate_content)/len(joke_riddle_requests)*100:.1f}%",
-                "interactivity_rate": f"{len(interactive_content)/len(joke_riddle_requests)*100:.1f}%",
-                "detailed_results": joke_riddle_results
+                spec.total_key: total,
+                **counts,
+                **rates,
+                "detailed_results": results
             }
             
         except Exception as e:
@@ -1986,25 +1913,23 @@ class BackendTester:
                     "message": request
                 }
                 
+                await self.rate.acquire()
                 async with self.session.post(
                     f"{BACKEND_URL}/conversations/text",
                     json=text_input
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         response_text = data.get("response_text", "")
                         
                         # Check for emotional expressions
-                        has_emotions = any(emotion in response_text for emotion in 
-                                         ["😂", "🤯", "✨", "🎵", "🎭", "🌟", "💫", "🎪"])
+                        has_emotions = bool(_EMOTION_RE.search(response_text))
                         
                         # Check for re-engagement prompts
-                        has_reengagement = any(prompt in response_text.lower() for prompt in 
-                                             ["want another", "should we", "would you like", "let's try", "how about"])
+                        has_reengagement = bool(_REENGAGEMENT_RE.search(response_text))
                         
                         # Check for engaging language
-                        has_engaging_language = any(engaging in response_text.lower() for engaging in 
-                                                  ["amazing", "wonderful", "fantastic", "incredible", "awesome", "great"])
+                        has_engaging_language = bool(_ENGAGING_RE.search(response_text))
                         
                         quality_results.append({
                             "request": request,
@@ -2014,8 +1939,6 @@ class BackendTester:
                             "response_length": len(response_text),
                             "response_preview": response_text[:150] + "..." if len(response_text) > 150 else response_text
                         })
-                
-                await asyncio.sleep(0.2)
             
             # Calculate quality metrics
             responses_with_emotions = [r for r in quality_results if r.get("has_emotions", False)]
@@ -2061,21 +1984,20 @@ class BackendTester:
                     "message": request
                 }
                 
+                await self.rate.acquire()
                 async with self.session.post(
                     f"{BACKEND_URL}/conversations/text",
                     json=text_input
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         response_text = data.get("response_text", "")
                         
                         # Check if content is age-appropriate
-                        is_age_appropriate = not any(inappropriate in response_text.lower() for inappropriate in 
-                                                   ["scary", "violent", "inappropriate", "adult", "frightening"])
+                        is_age_appropriate = not _INAPPROPRIATE_RE.search(response_text)
                         
                         # Check if system redirected inappropriate requests
-                        has_redirection = any(redirect in response_text.lower() for redirect in 
-                                            ["instead", "how about", "let me tell you", "better idea"])
+                        has_redirection = bool(_REDIRECTION_RE.search(response_text))
                         
                         age_results.append({
                             "request": request,
@@ -2083,8 +2005,6 @@ class BackendTester:
                             "has_redirection": has_redirection,
                             "response_preview": response_text[:150] + "..." if len(response_text) > 150 else response_text
                         })
-                
-                await asyncio.sleep(0.2)
             
             # Calculate filtering effectiveness
             appropriate_responses = [r for r in age_results if r.get("is_age_appropriate", False)]
@@ -2126,20 +2046,20 @@ class BackendTester:
                     "message": request
                 }
                 
+                await self.rate.acquire()
                 async with self.session.post(
                     f"{BACKEND_URL}/conversations/text",
                     json=text_input
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         response_text = data.get("response_text", "")
                         metadata = data.get("metadata", {})
                         
                         # Check content source (local vs LLM generated)
                         content_source = metadata.get("content_source", "unknown")
                         is_generated = len(response_text) > 100  # Generated content tends to be longer
-                        has_personalization = any(personal in response_text.lower() for personal in 
-                                                ["emma", "you", "your", "for you", "just for"])
+                        has_personalization = bool(_PERSONALIZATION_RE.search(response_text))
                         
                         fallback_results.append({
                             "request": request,
@@ -2149,8 +2069,6 @@ class BackendTester:
                             "response_length": len(response_text),
                             "response_preview": response_text[:150] + "..." if len(response_text) > 150 else response_text
                         })
-                
-                await asyncio.sleep(0.2)
             
             # Analyze sourcing patterns
             local_content = [r for r in fallback_results if r.get("content_source") == "library"]
@@ -2196,21 +2114,20 @@ class BackendTester:
                     "message": input_text
                 }
                 
+                await self.rate.acquire()
                 async with self.session.post(
                     f"{BACKEND_URL}/conversations/text",
                     json=text_input
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         response_text = data.get("response_text", "")
                         content_type = data.get("content_type", "")
                         
                         # Analyze engagement response
                         understands_child_input = self._analyze_child_input_understanding(input_text, response_text, content_type)
-                        has_empathy = any(empathy in response_text.lower() for empathy in 
-                                        ["understand", "feel", "sorry", "here for you", "help"])
-                        offers_activity = any(activity in response_text.lower() for activity in 
-                                            ["let's", "how about", "want to", "shall we", "would you like"])
+                        has_empathy = bool(_EMPATHY_RE.search(response_text))
+                        offers_activity = bool(_ACTIVITY_OFFER_RE.search(response_text))
                         
                         engagement_results.append({
                             "child_input": input_text,
@@ -2220,8 +2137,6 @@ class BackendTester:
                             "content_type": content_type,
                             "response_preview": response_text[:150] + "..." if len(response_text) > 150 else response_text
                         })
-                
-                await asyncio.sleep(0.2)
             
             # Calculate engagement metrics
             understood_inputs = [r for r in engagement_results if r.get("understands_input", False)]
@@ -2267,7 +2182,7 @@ class BackendTester:
                 json=voice_input
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     return {
                         "success": True,
                         "stt_endpoint_accessible": True,
@@ -2278,7 +2193,7 @@ class BackendTester:
                     }
                 elif response.status == 400:
                     # Expected for mock audio - STT correctly rejects invalid audio
-                    error_data = await response.json()
+                    error_data = await _json(response)
                     return {
                         "success": True,
                         "stt_endpoint_accessible": True,
@@ -2310,7 +2225,7 @@ class BackendTester:
                 json=text_input
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     response_audio = data.get("response_audio")
                     
                     if response_audio:
@@ -2363,7 +2278,7 @@ class BackendTester:
                 json=start_request
             ) as response:
                 if response.status == 200:
-                    start_data = await response.json()
+                    start_data = await _json(response)
                     
                     # Test wake word processing
                     wake_word_audio = b"hey buddy tell me a story" * 50  # Mock wake word audio
@@ -2379,7 +2294,7 @@ class BackendTester:
                         json=process_request
                     ) as process_response:
                         if process_response.status == 200:
-                            process_data = await process_response.json()
+                            process_data = await _json(process_response)
                             
                             # Stop ambient listening
                             stop_request = {"session_id": self.test_session_id}
@@ -2425,7 +2340,7 @@ class BackendTester:
                     "working": response.status == 200
                 }
                 if response.status == 200:
-                    start_data = await response.json()
+                    start_data = await _json(response)
                     pipeline_results["start_ambient"]["data"] = start_data
             
             # Test 2: Check ambient status
@@ -2437,7 +2352,7 @@ class BackendTester:
                     "working": response.status == 200
                 }
                 if response.status == 200:
-                    status_data = await response.json()
+                    status_data = await _json(response)
                     pipeline_results["ambient_status"]["data"] = status_data
             
             # Test 3: Process ambient audio
@@ -2458,7 +2373,7 @@ class BackendTester:
                     "working": response.status == 200
                 }
                 if response.status == 200:
-                    process_data = await response.json()
+                    process_data = await _json(response)
                     pipeline_results["process_ambient"]["data"] = process_data
             
             # Test 4: Stop ambient listening
@@ -2472,7 +2387,7 @@ class BackendTester:
                     "working": response.status == 200
                 }
                 if response.status == 200:
-                    stop_data = await response.json()
+                    stop_data = await _json(response)
                     pipeline_results["stop_ambient"]["data"] = stop_data
             
             # Calculate success rate
@@ -2514,7 +2429,7 @@ class BackendTester:
             ) as response:
                 if response.status in [200, 400]:  # 400 is acceptable for mock audio
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         response_text = data.get("response_text", "")
                         response_audio = data.get("response_audio")
                         content_type = data.get("content_type", "")
@@ -2566,7 +2481,7 @@ class BackendTester:
         try:
             async with self.session.get(f"{BACKEND_URL}/voice/personalities") as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     
                     # Expected personalities
                     expected_personalities = ["friendly_companion", "story_narrator", "learning_buddy"]
@@ -2616,7 +2531,7 @@ class BackendTester:
                 json=text_input
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     response_audio = data.get("response_audio")
                     
                     if response_audio:
@@ -2675,7 +2590,7 @@ class BackendTester:
                 json=start_request
             ) as response:
                 if response.status == 200:
-                    start_data = await response.json()
+                    start_data = await _json(response)
                     configured_wake_words = start_data.get("wake_words", [])
                     
                     # Expected wake words
@@ -2746,7 +2661,7 @@ class BackendTester:
                     "status_code": response.status
                 }
                 if response.status == 200:
-                    start_data = await response.json()
+                    start_data = await _json(response)
                     session_tests["session_start"]["listening_state"] = start_data.get("listening_state")
             
             # Test 2: Check session status
@@ -2758,7 +2673,7 @@ class BackendTester:
                     "status_code": response.status
                 }
                 if response.status == 200:
-                    status_data = await response.json()
+                    status_data = await _json(response)
                     session_tests["session_status"]["data"] = status_data
                     session_tests["session_status"]["has_session_id"] = bool(status_data.get("session_id"))
                     session_tests["session_status"]["has_listening_state"] = bool(status_data.get("listening_state"))
@@ -2781,7 +2696,7 @@ class BackendTester:
                     "status_code": response.status
                 }
                 if response.status == 200:
-                    process_data = await response.json()
+                    process_data = await _json(response)
                     session_tests["session_processing"]["status"] = process_data.get("status")
             
             # Test 4: Stop session
@@ -2795,7 +2710,7 @@ class BackendTester:
                     "status_code": response.status
                 }
                 if response.status == 200:
-                    stop_data = await response.json()
+                    stop_data = await _json(response)
                     session_tests["session_stop"]["listening_state"] = stop_data.get("listening_state")
             
             # Calculate success metrics
@@ -2843,7 +2758,7 @@ class BackendTester:
                     json=text_input
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         response_audio = data.get("response_audio")
                         
                         if response_audio:
@@ -2908,22 +2823,6 @@ class BackendTester:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    def _check_rhyming_pattern(self, text: str) -> bool:
-        """Check if text contains rhyming patterns"""
-        # Simple rhyme detection - look for common rhyming endings
-        lines = text.split('\n')
-        if len(lines) < 2:
-            return False
-        
-        # Check for common nursery rhyme patterns
-        rhyme_patterns = [
-            ("wall", "fall"), ("hill", "jill"), ("dock", "clock"),
-            ("lamb", "snow"), ("star", "are"), ("high", "sky")
-        ]
-        
-        text_lower = text.lower()
-        return any(pattern[0] in text_lower and pattern[1] in text_lower for pattern in rhyme_patterns)
-    
     def _analyze_child_input_understanding(self, input_text: str, response_text: str, content_type: str) -> bool:
         """Analyze if the system understood child-like input correctly"""
         input_lower = input_text.lower()
@@ -2956,7 +2855,7 @@ class BackendTester:
                 if response.status != 200:
                     return {"success": False, "error": "Backend not available for API compliance check"}
                 
-                health_data = await response.json()
+                health_data = await _json(response)
                 deepgram_configured = health_data.get("agents", {}).get("deepgram_configured", False)
                 
                 if not deepgram_configured:
@@ -2965,7 +2864,7 @@ class BackendTester:
             # Test voice personalities endpoint to verify REST API integration
             async with self.session.get(f"{BACKEND_URL}/voice/personalities") as response:
                 if response.status == 200:
-                    personalities = await response.json()
+                    personalities = await _json(response)
                     
                     # Verify all personalities use aura-2-amalthea-en model as specified
                     expected_model = "aura-2-amalthea-en"
@@ -3018,7 +2917,7 @@ class BackendTester:
                     # by checking the response structure and error handling
                     
                     if response.status == 400:
-                        error_data = await response.json()
+                        error_data = await _json(response)
                         # Check if error indicates STT processing (good sign)
                         error_detail = error_data.get("detail", "").lower()
                         
@@ -3038,7 +2937,7 @@ class BackendTester:
                         }
                     else:
                         # Successful response (unexpected with mock data, but good)
-                        data = await response.json()
+                        data = await _json(response)
                         return {
                             "success": True,
                             "stt_endpoint_accessible": True,
@@ -3071,7 +2970,7 @@ class BackendTester:
                 json=text_input
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     response_audio = data.get("response_audio")
                     
                     if response_audio:
@@ -3145,7 +3044,7 @@ class BackendTester:
                     json=text_input
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         
                         pipeline_results.append({
                             "message": message,
@@ -3196,7 +3095,7 @@ class BackendTester:
                 json=start_request
             ) as response:
                 if response.status == 200:
-                    start_data = await response.json()
+                    start_data = await _json(response)
                     
                     # Verify wake words are configured
                     wake_words = start_data.get("wake_words", [])
@@ -3209,7 +3108,7 @@ class BackendTester:
                         f"{BACKEND_URL}/ambient/status/{self.test_session_id}"
                     ) as status_response:
                         if status_response.status == 200:
-                            status_data = await status_response.json()
+                            status_data = await _json(status_response)
                             
                             return {
                                 "success": True,
@@ -3306,7 +3205,7 @@ class BackendTester:
         try:
             async with self.session.get(f"{BACKEND_URL}/voice/personalities") as response:
                 if response.status == 200:
-                    personalities = await response.json()
+                    personalities = await _json(response)
                     
                     # Expected personalities as per specification
                     expected_personalities = ["friendly_companion", "story_narrator", "learning_buddy"]
@@ -3365,7 +3264,7 @@ class BackendTester:
                 json=text_input
             ) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     return {
                         "personality_response": bool(data.get("response_text")),
                         "audio_generated": bool(data.get("response_audio")),
@@ -3377,7 +3276,7 @@ class BackendTester:
         except Exception as e:
             return {"error": str(e)}
     
-    async def test_stories_content_library(self):
+    async def test_rate_limit_mic_lock(self):
         """Test mic lock functionality - verify microphone gets locked after rate limiting"""
         if not self.test_user_id or not self.test_session_id:
             return {"success": False, "error": "Missing test user ID or session ID"}
@@ -3410,7 +3309,7 @@ class BackendTester:
                     json=text_input
                 ) as conv_response:
                     if conv_response.status == 200:
-                        data = await conv_response.json()
+                        data = await _json(conv_response)
                         rapid_interactions.append({
                             "interaction": i,
                             "content_type": data.get("content_type"),
@@ -3480,7 +3379,7 @@ class BackendTester:
                     json=text_input
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         content_type = data.get("content_type", "")
                         response_text = data.get("response_text", "")
                         
@@ -3554,7 +3453,7 @@ class BackendTester:
                     json=text_input
                 ) as conv_response:
                     if conv_response.status == 200:
-                        data = await conv_response.json()
+                        data = await _json(conv_response)
                         interactions.append({
                             "interaction": i,
                             "content_type": data.get("content_type"),
@@ -3580,7 +3479,7 @@ class BackendTester:
                 f"{BACKEND_URL}/ambient/status/{self.test_session_id}"
             ) as status_response:
                 if status_response.status == 200:
-                    status_data = await status_response.json()
+                    status_data = await _json(status_response)
                     
                     return {
                         "success": True,
@@ -3632,7 +3531,7 @@ class BackendTester:
                     json=text_input
                 ) as conv_response:
                     if conv_response.status == 200:
-                        data = await conv_response.json()
+                        data = await _json(conv_response)
                         content_type = data.get("content_type")
                         
                         interaction_results.append({
@@ -3691,7 +3590,7 @@ class BackendTester:
                 json=start_request
             ) as response:
                 if response.status == 200:
-                    start_data = await response.json()
+                    start_data = await _json(response)
                 else:
                     return {"success": False, "error": f"Failed to start ambient listening: {response.status}"}
             
@@ -3718,14 +3617,14 @@ class BackendTester:
                 f"{BACKEND_URL}/ambient/status/{self.test_session_id}"
             ) as status_response:
                 if status_response.status == 200:
-                    status_data = await status_response.json()
+                    status_data = await _json(status_response)
                     
                     # Test session end to get telemetry data
                     async with self.session.post(
                         f"{BACKEND_URL}/session/end/{self.test_session_id}"
                     ) as end_response:
                         if end_response.status == 200:
-                            end_data = await end_response.json()
+                            end_data = await _json(end_response)
                             
                             return {
                                 "success": True,
@@ -3794,7 +3693,7 @@ class BackendTester:
                     json=text_input
                 ) as conv_response:
                     if conv_response.status == 200:
-                        data = await conv_response.json()
+                        data = await _json(conv_response)
                         content_type = data.get("content_type")
                         response_text = data.get("response_text", "")
                         metadata = data.get("metadata", {})
@@ -3874,7 +3773,7 @@ class BackendTester:
                     json=text_input
                 ) as conv_response:
                     if conv_response.status == 200:
-                        data = await conv_response.json()
+                        data = await _json(conv_response)
                         content_type = data.get("content_type")
                         response_text = data.get("response_text", "")
                         metadata = data.get("metadata", {})
@@ -3939,7 +3838,7 @@ class BackendTester:
                     json=text_input
                 ) as conv_response:
                     if conv_response.status == 200:
-                        data = await conv_response.json()
+                        data = await _json(conv_response)
                         content_type = data.get("content_type")
                         response_text = data.get("response_text", "")
                         metadata = data.get("metadata", {})
@@ -3972,7 +3871,7 @@ class BackendTester:
                 f"{BACKEND_URL}/ambient/status/{self.test_session_id}"
             ) as status_response:
                 if status_response.status == 200:
-                    status_data = await status_response.json()
+                    status_data = await _json(status_response)
                     
                     return {
                         "success": True,
@@ -4032,7 +3931,7 @@ class BackendTester:
                 f"{BACKEND_URL}/session/end/{self.test_session_id}"
             ) as end_response:
                 if end_response.status == 200:
-                    end_data = await end_response.json()
+                    end_data = await _json(end_response)
                     
                     # Check if interaction count is tracked
                     interactions_tracked = end_data.get("interactions", 0)
@@ -4076,14 +3975,14 @@ class BackendTester:
                 json=start_request
             ) as response:
                 if response.status == 200:
-                    start_data = await response.json()
+                    start_data = await _json(response)
                     
                     # Check session status to verify tracking was initialized
                     async with self.session.get(
                         f"{BACKEND_URL}/ambient/status/{test_session_id}"
                     ) as status_response:
                         if status_response.status == 200:
-                            status_data = await status_response.json()
+                            status_data = await _json(status_response)
                             
                             # Stop ambient listening to clean up
                             stop_request = {"session_id": test_session_id}
@@ -4138,7 +4037,7 @@ class BackendTester:
                     json=start_request
                 ) as response:
                     if response.status == 200:
-                        start_data = await response.json()
+                        start_data = await _json(response)
                         
                         # Send a few interactions to each session
                         for j in range(2):
@@ -4160,7 +4059,7 @@ class BackendTester:
                             f"{BACKEND_URL}/ambient/status/{session_id}"
                         ) as status_response:
                             if status_response.status == 200:
-                                status_data = await status_response.json()
+                                status_data = await _json(status_response)
                                 session_results.append({
                                     "session_id": session_id,
                                     "start_successful": bool(start_data.get("status")),
@@ -4242,7 +4141,7 @@ class BackendTester:
                     json=text_input
                 ) as conv_response:
                     if conv_response.status == 200:
-                        data = await conv_response.json()
+                        data = await _json(conv_response)
                         content_type = data.get("content_type")
                         
                         # Track special response types that indicate telemetry events
@@ -4261,14 +4160,14 @@ class BackendTester:
                 f"{BACKEND_URL}/analytics/dashboard/{self.test_user_id}?days=1"
             ) as analytics_response:
                 if analytics_response.status == 200:
-                    analytics_data = await analytics_response.json()
+                    analytics_data = await _json(analytics_response)
                     
                     # End session to get final telemetry
                     async with self.session.post(
                         f"{BACKEND_URL}/session/end/{self.test_session_id}"
                     ) as end_response:
                         if end_response.status == 200:
-                            end_data = await end_response.json()
+                            end_data = await _json(end_response)
                             
                             return {
                                 "success": True,
@@ -4314,78 +4213,30 @@ class BackendTester:
     async def test_error_handling(self):
         """Test error handling for invalid requests"""
         try:
-            error_tests = []
-            
-            # Test 1: Invalid user profile creation (age out of range)
-            try:
-                invalid_profile = {
-                    "name": "Test",
-                    "age": 15,  # Invalid age
-                    "location": "Test"
-                }
-                async with self.session.post(
-                    f"{BACKEND_URL}/users/profile",
-                    json=invalid_profile
-                ) as response:
-                    error_tests.append({
-                        "test": "invalid_age",
-                        "status": response.status,
-                        "handled_correctly": response.status in [400, 422]
-                    })
-            except Exception as e:
-                error_tests.append({"test": "invalid_age", "error": str(e)})
-            
-            # Test 2: Non-existent user profile
-            try:
-                fake_user_id = str(uuid.uuid4())
-                async with self.session.get(
-                    f"{BACKEND_URL}/users/profile/{fake_user_id}"
-                ) as response:
-                    error_tests.append({
-                        "test": "nonexistent_user",
-                        "status": response.status,
-                        "handled_correctly": response.status == 404
-                    })
-            except Exception as e:
-                error_tests.append({"test": "nonexistent_user", "error": str(e)})
-            
-            # Test 3: Invalid conversation input
-            try:
-                invalid_text = {
-                    "session_id": "invalid_session",
-                    "user_id": "invalid_user",
-                    "message": ""
-                }
-                async with self.session.post(
-                    f"{BACKEND_URL}/conversations/text",
-                    json=invalid_text
-                ) as response:
-                    error_tests.append({
-                        "test": "invalid_conversation",
-                        "status": response.status,
-                        "handled_correctly": response.status in [400, 404, 422]
-                    })
-            except Exception as e:
-                error_tests.append({"test": "invalid_conversation", "error": str(e)})
-            
-            # Test 4: Invalid memory snapshot request
-            try:
-                fake_user_id = str(uuid.uuid4())
-                async with self.session.post(
-                    f"{BACKEND_URL}/memory/snapshot/{fake_user_id}"
-                ) as response:
-                    error_tests.append({
-                        "test": "invalid_memory_snapshot",
-                        "status": response.status,
-                        "handled_correctly": response.status in [404, 500]
-                    })
-            except Exception as e:
-                error_tests.append({"test": "invalid_memory_snapshot", "error": str(e)})
+            async def check(test, method, path, accepted, **kwargs):
+                try:
+                    async with self.session.request(method, f"{BACKEND_URL}{path}", **kwargs) as response:
+                        return ErrorTestResult(test, response.status, response.status in accepted)
+                except Exception as e:
+                    return ErrorTestResult(test, error=str(e))
+            
+            # The checks hit unrelated endpoints, so they run concurrently
+            error_tests = await asyncio.gather(
+                # Test 1: Invalid user profile creation (age out of range)
+                check("invalid_age", "POST", "/users/profile", (400, 422), json=dict(_INVALID_AGE_PROFILE)),
+                # Test 2: Non-existent user profile
+                check("nonexistent_user", "GET", f"/users/profile/{uuid.uuid4()}", (404,)),
+                # Test 3: Invalid conversation input
+                check("invalid_conversation", "POST", "/conversations/text", (400, 404, 422),
+                      json=dict(_INVALID_CONVERSATION)),
+                # Test 4: Invalid memory snapshot request
+                check("invalid_memory_snapshot", "POST", f"/memory/snapshot/{uuid.uuid4()}", (404, 500))
+            )
             
             return {
                 "success": True,
                 "error_tests": error_tests,
-                "properly_handled": sum(1 for test in error_tests if test.get("handled_correctly", False))
+                "properly_handled": sum(1 for test in error_tests if test.handled_correctly)
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -4461,7 +4312,7 @@ class BackendTester:
         try:
             async with self.session.get(f"{BACKEND_URL}/content/stories") as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     stories = data.get("stories", [])
                     
                     # Verify stories structure and content
@@ -4516,7 +4367,7 @@ class BackendTester:
             for content_type in content_types:
                 async with self.session.get(f"{BACKEND_URL}/content/{content_type}") as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         content_list = data.get("content", [])
                         
                         content_results[content_type] = {
@@ -4594,7 +4445,7 @@ class BackendTester:
                     json=request_data
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await _json(response)
                         
                         generation_results.append({
                             "content_type": request_data["content_type"],
@@ -4736,7 +4587,7 @@ class BackendTester:
                 if response.status != 200:
                     return {"success": False, "error": f"Riddle request failed: HTTP {response.status}"}
                 
-                riddle_data = await response.json()
+                riddle_data = await _json(response)
                 riddle_response = riddle_data.get("response_text", "")
                 
                 # Step 2: Respond with "I don't know"
@@ -4755,7 +4606,7 @@ class BackendTester:
                     if followup_response.status != 200:
                         return {"success": False, "error": f"Followup failed: HTTP {followup_response.status}"}
                     
-                    followup_data = await followup_response.json()
+                    followup_data = await _json(followup_response)
                     followup_text = followup_data.get("response_text", "")
                     
                     # Check if context is maintained (bot should provide the answer)
@@ -4800,7 +4651,7 @@ class BackendTester:
                 if response.status != 200:
                     return {"success": False, "error": f"Question request failed: HTTP {response.status}"}
                 
-                question_data = await response.json()
+                question_data = await _json(response)
                 question_response = question_data.get("response_text", "")
                 
                 # Step 2: Follow up on the response
@@ -4819,7 +4670,7 @@ class BackendTester:
                     if followup_response.status != 200:
                         return {"success": False, "error": f"Followup failed: HTTP {followup_response.status}"}
                     
-                    followup_data = await followup_response.json()
+                    followup_data = await _json(followup_response)
                     followup_text = followup_data.get("response_text", "")
                     
                     # Check if context is maintained (bot should reference previous response)
@@ -4865,7 +4716,7 @@ class BackendTester:
                 if response.status != 200:
                     return {"success": False, "error": f"Preference request failed: HTTP {response.status}"}
                 
-                preference_data = await response.json()
+                preference_data = await _json(response)
                 
                 # Step 2: Generate memory snapshot
                 await asyncio.sleep(0.5)
@@ -4889,7 +4740,7 @@ class BackendTester:
                     if memory_response.status != 200:
                         return {"success": False, "error": f"Memory test failed: HTTP {memory_response.status}"}
                     
-                    memory_data = await memory_response.json()
+                    memory_data = await _json(memory_response)
                     memory_story = memory_data.get("response_text", "")
                     metadata = memory_data.get("metadata", {})
                     
@@ -5003,5 +4854,12 @@ async def main():
         return passed_tests == total_tests
 
 if __name__ == "__main__":
+    # Use libuv's event loop when available; falls back to the stdlib loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     success = asyncio.run(main())
     exit(0 if success else 1)
\ No newline at end of file